@@ -1,55 +1,63 @@
 """FastAPI dependencies for dependency injection."""
 
-from functools import lru_cache
 from typing import Optional
 
+from fastapi import FastAPI, Request
+
 from ..config import get_settings
 from ..services import SearchService, QueryParser, IngestService
 from ..vector_store import QdrantVectorStore
 
 
-@lru_cache
-def get_vector_store() -> QdrantVectorStore:
-    """Get cached vector store instance."""
+def init_services(app: FastAPI) -> None:
+    """
+    Build the service singletons once and store them on `app.state`.
+
+    Called from the lifespan handler; each worker process builds its own set.
+    """
     settings = get_settings()
-    return QdrantVectorStore(
+    vector_store = QdrantVectorStore(
         host=settings.qdrant_host,
         port=settings.qdrant_port,
         collection_name=settings.qdrant_collection,
+        grpc_port=settings.qdrant_grpc_port,
+        prefer_grpc=settings.qdrant_prefer_grpc,
     )
+    app.state.vector_store = vector_store
+    app.state.search_service = SearchService(vector_store=vector_store)
+    app.state.ingest_service = IngestService(vector_store=vector_store)
+    # Query parsing needs OpenAI; without a key the parser is None
+    app.state.query_parser = QueryParser() if settings.openai_api_key else None
 
 
-@lru_cache
-def get_search_service() -> SearchService:
-    """Get cached search service instance."""
-    vector_store = get_vector_store()
-    return SearchService(vector_store=vector_store)
+def get_vector_store(request: Request) -> QdrantVectorStore:
+    """Get the vector store instance."""
+    return request.app.state.vector_store
 
 
-@lru_cache
-def get_ingest_service() -> IngestService:
-    """Get cached ingest service instance."""
-    vector_store = get_vector_store()
-    return IngestService(vector_store=vector_store)
+def get_search_service(request: Request) -> SearchService:
+    """Get the search service instance."""
+    return request.app.state.search_service
 
 
-def get_query_parser() -> Optional[QueryParser]:
+def get_ingest_service(request: Request) -> IngestService:
+    """Get the ingest service instance."""
+    return request.app.state.ingest_service
+
+
+def get_query_parser(request: Request) -> Optional[QueryParser]:
     """
-    Get query parser instance.
+    Get the query parser instance.
 
     Returns None if OpenAI API key is not configured.
     """
-    settings = get_settings()
-    if not settings.openai_api_key:
-        return None
-    return QueryParser()
+    return request.app.state.query_parser
 
 
-def warmup_services() -> None:
+async def warmup_services(app: FastAPI) -> None:
     """
     Warmup services on startup.
 
-    Pre-loads embedding models to avoid cold start latency.
+    Pre-loads embedding models (concurrently) to avoid cold start latency.
     """
-    search_service = get_search_service()
-    search_service.warmup_providers()
+    await app.state.search_service.warmup_providers()
@@ -0,0 +1,23 @@
+"""Response classes for the API layer."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Handlers on hot paths return this directly with plain dicts so FastAPI
+    skips `response_model` re-validation and `jsonable_encoder`; orjson
+    serializes datetimes (as ISO-8601, UTC with a `Z` suffix like Pydantic)
+    and numpy arrays natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+        )
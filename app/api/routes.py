@@ -1,44 +1,46 @@
 """API route definitions."""
 
 import logging
-import uuid
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
+from ..mappers import profile_point_id
 from ..models import (
     ParseRequest,
     ParseResponse,
     SearchRequest,
+    SEARCH_REQUEST_ADAPTER,
     SearchResponse,
-    SearchResult,
     CollectionInfoResponse,
     IngestUserProfile,
 )
-from ..models.responses import FilterAnalysis, FilterImpact, SearchResultPayload
+from ..models.responses import SearchResultPayload
 from ..services import SearchService, QueryParser, IngestService
 from ..vector_store import QdrantVectorStore
 from .dependencies import get_search_service, get_query_parser, get_vector_store, get_ingest_service
+from .responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.get("/collection/info", response_model=CollectionInfoResponse, tags=["collection"])
-async def collection_info(
+# Hot routes return ORJSONResponse directly; the models are kept in `responses`
+# for the OpenAPI schema only, so the return value is not re-validated.
+@router.get("/collection/info", responses={200: {"model": CollectionInfoResponse}}, tags=["collection"])
+def collection_info(
     vector_store: QdrantVectorStore = Depends(get_vector_store),
 ):
     """Get collection information."""
     try:
-        info = vector_store.collection_info()
-        return CollectionInfoResponse(**info)
+        return ORJSONResponse(vector_store.collection_info())
     except Exception as e:
         logger.error(f"Failed to get collection info: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/parse", response_model=ParseResponse, tags=["search"])
+@router.post("/parse", responses={200: {"model": ParseResponse}}, tags=["search"])
 async def parse_query(
     request: ParseRequest,
     query_parser: Optional[QueryParser] = Depends(get_query_parser),
@@ -55,20 +57,30 @@ async def parse_query(
         )
 
     try:
-        parsed = query_parser.parse(request.query)
-        return ParseResponse(
-            original_query=parsed["original_query"],
-            filters=parsed["filters"],
-            education_query=parsed["education_query"],
-            profession_query=parsed["profession_query"],
-            vibe_report_query=parsed["vibe_report_query"],
-        )
+        parsed = await query_parser.parse(request.query)
+        return ORJSONResponse({
+            "original_query": parsed["original_query"],
+            "filters": parsed["filters"],
+            "education_query": parsed["education_query"],
+            "profession_query": parsed["profession_query"],
+            "vibe_report_query": parsed["vibe_report_query"],
+        })
     except Exception as e:
         logger.error(f"Query parsing failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/search", response_model=SearchResponse, tags=["search"])
+# Public SearchResultPayload fields with their defaults. Payloads come from our
+# own ingest path, so search results are projected onto these fields (dropping
+# hashes/internal flags) without validating a model per hit. The defaults are
+# shared across responses and must not be mutated.
+_RESULT_PAYLOAD_FIELDS = tuple(
+    (name, field.get_default(call_default_factory=True))
+    for name, field in SearchResultPayload.model_fields.items()
+)
+
+
+@router.post("/search", responses={200: {"model": SearchResponse}}, tags=["search"])
 async def search(
     request: SearchRequest,
     search_service: SearchService = Depends(get_search_service),
@@ -80,6 +92,7 @@ async def search(
     If `query` is provided without `parsed_queries`, will auto-parse using LLM.
     """
     parsed_queries = request.parsed_queries
+    filters = request.filters
 
     # Auto-parse if raw query provided without parsed queries
     if request.query and not parsed_queries:
@@ -88,23 +101,11 @@ async def search(
                 status_code=400,
                 detail="Provide parsed_queries or configure OpenAI API key for auto-parsing"
             )
-        parsed = query_parser.parse(request.query)
-        parsed_queries = {
-            "education_query": parsed["education_query"],
-            "profession_query": parsed["profession_query"],
-            "vibe_report_query": parsed["vibe_report_query"],
-        }
-        # Merge parsed filters with request filters
-        if parsed["filters"]:
-            request_filters = request.filters or {}
-            filters = {**parsed["filters"], **request_filters}
-        else:
-            filters = request.filters
-    else:
-        filters = request.filters
+        # Parsed filters are merged under the request filters
+        parsed_queries, filters = await query_parser.parse_for_search(request.query, filters)
 
     try:
-        result = search_service.search(
+        result = await search_service.search(
             parsed_queries=parsed_queries,
             filters=filters,
             limit=request.limit,
@@ -113,41 +114,33 @@ async def search(
             skip_ids=request.skip_ids,
         )
 
-        # Build filter analysis response if present
-        filter_analysis = None
-        if result.get("filter_analysis"):
-            fa = result["filter_analysis"]
-            filter_analysis = FilterAnalysis(
-                impacts=[FilterImpact(**impact) for impact in fa["impacts"]],
-                recommendations=fa["recommendations"],
-                total_without_filters=fa["total_without_filters"],
-                current_count=fa["current_count"],
-            )
-
-        return SearchResponse(
-            query=request.query,
-            parsed=parsed_queries,
-            results=[
-                SearchResult(
-                    id=r["id"],
-                    score=r["score"],
-                    payload=SearchResultPayload(**r["payload"])
-                )
+        return ORJSONResponse({
+            "query": request.query,
+            "parsed": parsed_queries,
+            "results": [
+                {
+                    "id": r["id"],
+                    "score": r["score"],
+                    "payload": {
+                        name: r["payload"].get(name, default)
+                        for name, default in _RESULT_PAYLOAD_FIELDS
+                    },
+                }
                 for r in result["results"]
             ],
-            total_count=result["total_count"],
-            vectors_used=result["vectors_used"],
-            filters_applied=result["filters_applied"],
-            search_time_ms=result["search_time_ms"],
-            embedding_model=result["embedding_model"],
-            filter_analysis=filter_analysis,
-        )
+            "total_count": result["total_count"],
+            "vectors_used": result["vectors_used"],
+            "filters_applied": result["filters_applied"],
+            "search_time_ms": result["search_time_ms"],
+            "embedding_model": result["embedding_model"],
+            "filter_analysis": result.get("filter_analysis"),
+        })
     except Exception as e:
         logger.error(f"Search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/search", response_model=SearchResponse, tags=["search"])
+@router.get("/search", responses={200: {"model": SearchResponse}}, tags=["search"])
 async def search_get(
     q: Optional[str] = Query(None, description="Natural language search query"),
     education_query: Optional[str] = Query(None, description="Education semantic query"),
@@ -178,71 +171,84 @@ async def search_get(
     """
     # Build parsed queries if any semantic queries provided
     parsed_queries = None
-    if any([education_query, profession_query, vibe_report_query]):
+    if any((education_query, profession_query, vibe_report_query)):
         parsed_queries = {
             "education_query": education_query or "",
             "profession_query": profession_query or "",
             "vibe_report_query": vibe_report_query or "",
         }
 
-    # Build filters
-    filters = {}
-    if genders:
-        filters["genders"] = genders
-    if religions:
-        filters["religions"] = religions
-    if locations:
-        filters["locations"] = locations
-    if min_age is not None:
-        filters["min_age"] = min_age
-    if max_age is not None:
-        filters["max_age"] = max_age
-    if min_height is not None:
-        filters["min_height"] = min_height
-    if max_height is not None:
-        filters["max_height"] = max_height
-    if min_income is not None:
-        filters["min_income"] = min_income
-    if max_income is not None:
-        filters["max_income"] = max_income
-    if marital_statuses:
-        filters["marital_statuses"] = marital_statuses
-    if food_habits:
-        filters["food_habits"] = food_habits
-    if smoking:
-        filters["smoking"] = smoking
-    if drinking:
-        filters["drinking"] = drinking
+    # Build filters under the canonical keys understood by
+    # QueryMapper/FilterBuilder (empty lists and unset params are dropped)
+    filter_params = (
+        ("gender", genders),
+        ("religion", religions),
+        ("location", locations),
+        ("min_age", min_age),
+        ("max_age", max_age),
+        ("min_height", min_height),
+        ("max_height", max_height),
+        ("min_income", min_income),
+        ("max_income", max_income),
+        ("marital_status", marital_statuses),
+        ("food_habit", food_habits),
+        ("smoking", smoking),
+        ("drinking", drinking),
+    )
+    filters = {
+        filter_key: value
+        for filter_key, value in filter_params
+        if value is not None and value != []
+    }
 
     # Create request and delegate
-    request = SearchRequest(
-        query=q,
-        parsed_queries=parsed_queries,
-        filters=filters if filters else None,
-        limit=limit,
-        offset=offset,
-    )
+    request = SEARCH_REQUEST_ADAPTER.validate_python({
+        "query": q,
+        "parsed_queries": parsed_queries,
+        "filters": filters if filters else None,
+        "limit": limit,
+        "offset": offset,
+    })
 
     return await search(request, search_service, query_parser)
 
 
 @router.post("/ingest", tags=["ingest"])
-async def ingest_profile(
+def ingest_profile(
     profile: IngestUserProfile,
     ingest_service: IngestService = Depends(get_ingest_service),
 ):
-    """Ingest a single user profile into Qdrant."""
+    """
+    Ingest a single user profile into Qdrant.
+
+    Declared sync so FastAPI runs it in the threadpool; ingestion makes
+    blocking OpenAI/ColBERT/Qdrant calls that would otherwise stall the loop.
+    """
     user = ingest_service.ingest(profile)
     return user
 
 
+@router.post("/ingest/batch", tags=["ingest"])
+def ingest_profiles(
+    profiles: List[IngestUserProfile],
+    ingest_service: IngestService = Depends(get_ingest_service),
+):
+    """
+    Ingest many user profiles with batched Qdrant/embedding round-trips.
+
+    Sync for the same reason as `/ingest`.
+    """
+    users = ingest_service.ingest_batch(profiles)
+    return users
+
+
 @router.get("/profile/{profile_id}", tags=["profile"])
-async def get_profile(
+def get_profile(
     profile_id: str,
     vector_store: QdrantVectorStore = Depends(get_vector_store),
 ):
     """Fetch a profile by ID."""
-    point_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, profile_id))
+    point_id = profile_point_id(profile_id)
     point = vector_store.get_point(point_id)
     if not point:
         raise HTTPException(status_code=404, detail="Profile not found")
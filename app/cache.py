@@ -0,0 +1,136 @@
+"""Small caches shared by services and providers."""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """
+    Bounded least-recently-used cache with optional per-entry TTL.
+
+    Not thread-safe across awaits/threads beyond what dict operations give;
+    a lost update only costs a recomputation.
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """
+        Args:
+            maxsize: Maximum number of entries (0 disables caching)
+            ttl: Seconds an entry stays valid after it is stored (None or 0
+                keeps entries until evicted)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl or None
+        self._data: "OrderedDict[Hashable, V]" = OrderedDict()
+        # Expiry deadlines (time.monotonic), only tracked when ttl is set
+        self._expires: Dict[Hashable, float] = {}
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value (marking it recently used) or None."""
+        value = self._data.get(key)
+        if value is not None:
+            if self.ttl is not None and self._expires.get(key, 0.0) <= time.monotonic():
+                self._discard(key)
+                return None
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                # Evicted by another thread in between
+                pass
+        return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.ttl is not None:
+            self._expires[key] = time.monotonic() + self.ttl
+        while len(self._data) > self.maxsize:
+            evicted, _ = self._data.popitem(last=False)
+            self._expires.pop(evicted, None)
+
+    def _discard(self, key: Hashable) -> None:
+        """Drop an entry if present."""
+        self._data.pop(key, None)
+        self._expires.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+        self._expires.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    Persistent string cache in a single SQLite table.
+
+    Survives restarts and is shared by every worker process using the same
+    file (WAL mode). Expiry uses wall-clock time since entries outlive the
+    process. Storage errors are logged and treated as misses; like
+    LRUCache, a lost entry only costs a recomputation.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+            ttl: Seconds an entry stays valid after it is stored (None or 0
+                keeps entries forever)
+        """
+        self.path = path
+        self.ttl = ttl or None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value or None (missing, expired, or unreadable)."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and row[1] is not None and row[1] <= time.time():
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    return None
+        except sqlite3.Error as e:
+            logger.warning("SQLite cache read failed (%s): %s", self.path, e)
+            return None
+        return row[0] if row is not None else None
+
+    def put(self, key: str, value: str) -> None:
+        """Store a value, replacing any existing entry."""
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+        except sqlite3.Error as e:
+            logger.warning("SQLite cache write failed (%s): %s", self.path, e)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
@@ -29,21 +29,38 @@ class Settings(BaseSettings):
     # Qdrant
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
+    qdrant_grpc_port: int = 6334
+    qdrant_prefer_grpc: bool = True  # gRPC skips the REST client's JSON/Pydantic round-trip
     qdrant_collection: str = "matrimonial_profiles"
 
     # OpenAI (for query parsing and embeddings)
     openai_api_key: Optional[str] = None
     openai_model: str = "gpt-4o-mini"
+    openai_concurrency: int = 4  # Concurrent vibe map requests per ingest batch
+    query_parser_cache_size: int = 4096  # Parsed queries kept in memory (0 disables)
+    query_parser_cache_ttl: int = 86400  # Seconds a cached parse stays valid (0 = until evicted)
+    query_parser_fast_path: bool = True  # Parse filter-only queries locally (regex) instead of via the LLM
+    vibe_cache_enabled: bool = True  # Reuse vibe maps for unchanged inputs across restarts
+    vibe_cache_path: str = "vibe_cache.sqlite3"  # SQLite file shared by all workers
+    vibe_cache_ttl: int = 604800  # Seconds a cached vibe map stays valid (0 = forever)
 
     # Embedding
     embedding_device: str = "cpu"  # cpu, cuda, mps
+    dense_provider: str = "openai-small"  # openai-small, fastembed-small (changing requires a reindex)
     colbert_batch_size: int = 20
+    # Vector quantization: binary, scalar (int8), none; "auto" picks binary for
+    # ≥1024d dense vectors, else scalar (changing requires recreating the collection)
+    dense_quantization: str = "auto"
+    colbert_quantization: str = "scalar"
+    embedding_cache_size: int = 8192  # Cached OpenAI text embeddings (0 disables)
 
     # Search defaults
     default_search_limit: int = 100
     max_search_limit: int = 200
     prefetch_limit: int = 1000
     score_threshold: float = 0.0
+    filter_analysis_cache_size: int = 1024  # Cached filter impact analyses (0 disables)
+    filter_analysis_cache_ttl: int = 60  # Seconds a cached analysis stays valid
 
     # CloudFront (for photo URLs)
     cloud_front_url: str = "https://d34thlcszyehjn.cloudfront.net"
@@ -54,25 +71,40 @@ def get_settings() -> Settings:
     """Get cached settings instance."""
     settings = Settings()
 
-    # Log all settings on first load
-    logger.info("=" * 50)
-    logger.info("CONFIGURATION LOADED")
-    logger.info("=" * 50)
-    logger.info(f"APP_ENV: {settings.app_env}")
-    logger.info(f"APP_NAME: {settings.app_name}")
-    logger.info(f"DEBUG: {settings.debug}")
-    logger.info(f"QDRANT_HOST: {settings.qdrant_host}")
-    logger.info(f"QDRANT_PORT: {settings.qdrant_port}")
-    logger.info(f"QDRANT_COLLECTION: {settings.qdrant_collection}")
-    logger.info(f"OPENAI_API_KEY: {'***' + settings.openai_api_key[-4:] if settings.openai_api_key else 'NOT SET'}")
-    logger.info(f"OPENAI_MODEL: {settings.openai_model}")
-    logger.info(f"EMBEDDING_DEVICE: {settings.embedding_device}")
-    logger.info(f"COLBERT_BATCH_SIZE: {settings.colbert_batch_size}")
-    logger.info(f"DEFAULT_SEARCH_LIMIT: {settings.default_search_limit}")
-    logger.info(f"MAX_SEARCH_LIMIT: {settings.max_search_limit}")
-    logger.info(f"PREFETCH_LIMIT: {settings.prefetch_limit}")
-    logger.info(f"SCORE_THRESHOLD: {settings.score_threshold}")
-    logger.info(f"CLOUD_FRONT_URL: {settings.cloud_front_url}")
-    logger.info("=" * 50)
+    # Log all settings on first load (DEBUG; lazy formatting)
+    logger.debug("=" * 50)
+    logger.debug("CONFIGURATION LOADED")
+    logger.debug("=" * 50)
+    logger.debug("APP_ENV: %s", settings.app_env)
+    logger.debug("APP_NAME: %s", settings.app_name)
+    logger.debug("DEBUG: %s", settings.debug)
+    logger.debug("QDRANT_HOST: %s", settings.qdrant_host)
+    logger.debug("QDRANT_PORT: %s", settings.qdrant_port)
+    logger.debug("QDRANT_GRPC_PORT: %s", settings.qdrant_grpc_port)
+    logger.debug("QDRANT_PREFER_GRPC: %s", settings.qdrant_prefer_grpc)
+    logger.debug("QDRANT_COLLECTION: %s", settings.qdrant_collection)
+    logger.debug("OPENAI_API_KEY: %s", "***" + settings.openai_api_key[-4:] if settings.openai_api_key else "NOT SET")
+    logger.debug("OPENAI_MODEL: %s", settings.openai_model)
+    logger.debug("OPENAI_CONCURRENCY: %s", settings.openai_concurrency)
+    logger.debug("QUERY_PARSER_CACHE_SIZE: %s", settings.query_parser_cache_size)
+    logger.debug("QUERY_PARSER_CACHE_TTL: %s", settings.query_parser_cache_ttl)
+    logger.debug("QUERY_PARSER_FAST_PATH: %s", settings.query_parser_fast_path)
+    logger.debug("VIBE_CACHE_ENABLED: %s", settings.vibe_cache_enabled)
+    logger.debug("VIBE_CACHE_PATH: %s", settings.vibe_cache_path)
+    logger.debug("VIBE_CACHE_TTL: %s", settings.vibe_cache_ttl)
+    logger.debug("EMBEDDING_DEVICE: %s", settings.embedding_device)
+    logger.debug("DENSE_PROVIDER: %s", settings.dense_provider)
+    logger.debug("COLBERT_BATCH_SIZE: %s", settings.colbert_batch_size)
+    logger.debug("DENSE_QUANTIZATION: %s", settings.dense_quantization)
+    logger.debug("COLBERT_QUANTIZATION: %s", settings.colbert_quantization)
+    logger.debug("EMBEDDING_CACHE_SIZE: %s", settings.embedding_cache_size)
+    logger.debug("DEFAULT_SEARCH_LIMIT: %s", settings.default_search_limit)
+    logger.debug("MAX_SEARCH_LIMIT: %s", settings.max_search_limit)
+    logger.debug("PREFETCH_LIMIT: %s", settings.prefetch_limit)
+    logger.debug("SCORE_THRESHOLD: %s", settings.score_threshold)
+    logger.debug("FILTER_ANALYSIS_CACHE_SIZE: %s", settings.filter_analysis_cache_size)
+    logger.debug("FILTER_ANALYSIS_CACHE_TTL: %s", settings.filter_analysis_cache_ttl)
+    logger.debug("CLOUD_FRONT_URL: %s", settings.cloud_front_url)
+    logger.debug("=" * 50)
 
     return settings
@@ -4,7 +4,8 @@ from .base import EmbeddingProvider
 from .openai_provider import OpenAIEmbeddingProvider
 from .factory import EmbeddingProviderFactory
 
-# BGEColBERTProvider is imported lazily in factory to avoid transformers dependency issues
+# BGEColBERTProvider and FastEmbedProvider are imported lazily in factory to avoid
+# pulling in transformers / onnxruntime when they aren't configured
 
 __all__ = [
     "EmbeddingProvider",
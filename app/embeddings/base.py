@@ -1,45 +1,59 @@
 """Abstract base class for embedding providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Union
+from typing import ClassVar, List, Union
+
+import numpy as np
 
 
 class EmbeddingProvider(ABC):
-    """Base interface for all embedding providers."""
+    """
+    Base interface for all embedding providers.
 
-    @property
-    @abstractmethod
-    def model_id(self) -> str:
-        """Return the model identifier."""
-        pass
+    Subclasses declare `__slots__` and set `model_id` and `dimensions` as plain
+    attributes in `__init__` (no property dispatch on the hot path).
+    """
 
-    @property
-    @abstractmethod
-    def dimensions(self) -> int:
-        """Return embedding dimensions."""
-        pass
+    __slots__ = ()
 
-    @property
-    @abstractmethod
-    def is_late_interaction(self) -> bool:
-        """Return True if this produces multi-vectors (ColBERT-style)."""
-        pass
+    # Model identifier
+    model_id: str
+    # Embedding dimensions
+    dimensions: int
+    # True if this produces multi-vectors (ColBERT-style)
+    is_late_interaction: ClassVar[bool] = False
 
-    @abstractmethod
-    def embed(self, text: str) -> Union[List[float], List[List[float]]]:
+    def embed(self, text: str) -> Union[np.ndarray, List[float]]:
         """
         Generate embedding for a single text.
 
+        Delegates to `embed_batch`, which is the only path providers implement.
+
         Returns:
             - Dense: List[float] of length `dimensions`
-            - ColBERT: List[List[float]] of shape [num_tokens, dimensions]
+            - ColBERT: np.ndarray of shape [num_tokens, dimensions]
         """
-        pass
+        return self.embed_batch([text])[0]
 
     @abstractmethod
-    def embed_batch(self, texts: List[str]) -> List[Union[List[float], List[List[float]]]]:
-        """Generate embeddings for multiple texts."""
+    def embed_batch(self, texts: List[str]) -> List[Union[np.ndarray, List[float]]]:
+        """
+        Generate embeddings for multiple texts.
+
+        Empty texts get zero vectors so the output stays aligned with the input.
+        """
         pass
 
+    async def aembed_batch(self, texts: List[str]) -> List[Union[np.ndarray, List[float]]]:
+        """
+        Async variant of `embed_batch` for use inside request handlers.
+
+        Defaults to running `embed_batch` in a worker thread so local models
+        don't block the event loop; network-backed providers override this
+        with a native async client.
+        """
+        return await asyncio.to_thread(self.embed_batch, texts)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model_id}, dim={self.dimensions})"
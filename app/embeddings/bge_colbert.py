@@ -1,10 +1,12 @@
 """BGE-M3 ColBERT (late interaction) provider for vibe_report field."""
 
 import os
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 from FlagEmbedding import BGEM3FlagModel
 
+from ..config import get_settings
 from .base import EmbeddingProvider
 
 # Model ID constant
@@ -14,7 +16,11 @@ BGE_M3_MODEL_ID = "BAAI/bge-m3"
 class BGEColBERTProvider(EmbeddingProvider):
     """BGE-M3 ColBERT provider for multi-vector late interaction."""
 
-    def __init__(self, device: str = "cpu"):
+    __slots__ = ("_model", "_device", "_batch_size", "model_id", "dimensions")
+
+    is_late_interaction = True
+
+    def __init__(self, device: str = "cpu", batch_size: Optional[int] = None):
         """
         Initialize BGE-M3 ColBERT provider.
 
@@ -22,47 +28,25 @@ class BGEColBERTProvider(EmbeddingProvider):
 
         Args:
             device: Device to use (cpu, cuda, mps)
+            batch_size: Texts per encode forward pass (default from settings)
         """
         # Ensure cache directory is set (for Docker)
         cache_dir = os.environ.get("HF_HOME", os.environ.get("TRANSFORMERS_CACHE"))
 
         self._model = BGEM3FlagModel(BGE_M3_MODEL_ID, use_fp16=True, device=device)
-        self._dimensions = 1024
         self._device = device
+        self._batch_size = batch_size or get_settings().colbert_batch_size
+        self.model_id = "BAAI/bge-m3-colbert"
+        self.dimensions = 1024
 
-    @property
-    def model_id(self) -> str:
-        return "BAAI/bge-m3-colbert"
-
-    @property
-    def dimensions(self) -> int:
-        return self._dimensions
-
-    @property
-    def is_late_interaction(self) -> bool:
-        return True
-
-    def embed(self, text: str) -> List[List[float]]:
+    def embed_batch(self, texts: List[str]) -> List[np.ndarray]:
         """
-        Generate ColBERT multi-vector embedding for a single text.
+        Generate ColBERT multi-vector embeddings for multiple texts.
 
         Returns:
-            List[List[float]] of shape [num_tokens, 1024]
+            np.ndarray per text of shape [num_tokens, 1024], in the model's dtype
+            (float16 with use_fp16). Converted to lists only when sent to Qdrant.
         """
-        if not text or not text.strip():
-            # Return single zero vector for empty text
-            return [[0.0] * self._dimensions]
-
-        result = self._model.encode(
-            [text],
-            return_dense=False,
-            return_sparse=False,
-            return_colbert_vecs=True
-        )
-        return result["colbert_vecs"][0].tolist()
-
-    def embed_batch(self, texts: List[str]) -> List[List[List[float]]]:
-        """Generate ColBERT embeddings for multiple texts."""
         if not texts:
             return []
 
@@ -75,16 +59,23 @@ class BGEColBERTProvider(EmbeddingProvider):
                 non_empty_texts.append(text)
 
         # Initialize results with single zero vectors
-        results = [[[0.0] * self._dimensions] for _ in range(len(texts))]
+        results = [self._zero_vector() for _ in range(len(texts))]
 
         if non_empty_texts:
+            # FlagEmbedding tiles the input into batch_size chunks and moves
+            # each chunk to the device itself
             embeddings = self._model.encode(
                 non_empty_texts,
+                batch_size=self._batch_size,
                 return_dense=False,
                 return_sparse=False,
                 return_colbert_vecs=True
             )
             for idx, embedding in zip(non_empty_indices, embeddings["colbert_vecs"]):
-                results[idx] = embedding.tolist()
+                results[idx] = embedding
 
         return results
+
+    def _zero_vector(self) -> np.ndarray:
+        """Single all-zero token vector, used for empty text."""
+        return np.zeros((1, self.dimensions), dtype=np.float16)
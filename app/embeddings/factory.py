@@ -1,6 +1,6 @@
 """Factory for creating and managing embedding providers."""
 
-from typing import Dict, Optional, Type
+from typing import Dict, FrozenSet, Optional, Type
 
 from .base import EmbeddingProvider
 from .openai_provider import OpenAIEmbeddingProvider
@@ -18,7 +18,11 @@ class EmbeddingProviderFactory:
     }
 
     _instances: Dict[str, EmbeddingProvider] = {}
+    # API-backed providers embed server-side; device is dropped for them so
+    # callers passing different devices share one instance
+    _device_agnostic: FrozenSet[str] = frozenset({"openai-small"})
     _colbert_loaded: bool = False
+    _fastembed_loaded: bool = False
 
     @classmethod
     def _load_colbert(cls) -> None:
@@ -28,6 +32,14 @@ class EmbeddingProviderFactory:
             cls._providers["bge-colbert"] = BGEColBERTProvider
             cls._colbert_loaded = True
 
+    @classmethod
+    def _load_fastembed(cls) -> None:
+        """Lazy load fastembed provider so onnxruntime is only imported when used."""
+        if not cls._fastembed_loaded:
+            from .fastembed_provider import FastEmbedProvider
+            cls._providers["fastembed-small"] = FastEmbedProvider
+            cls._fastembed_loaded = True
+
     @classmethod
     def get_provider(
         cls,
@@ -39,7 +51,7 @@ class EmbeddingProviderFactory:
         Get or create a singleton provider instance.
 
         Args:
-            provider_type: Type of provider (bge-colbert, openai-small)
+            provider_type: Type of provider (bge-colbert, openai-small, fastembed-small)
             device: Device to use (cpu, cuda, mps)
             **kwargs: Additional provider arguments
 
@@ -49,9 +61,11 @@ class EmbeddingProviderFactory:
         # Lazy load ColBERT if requested
         if provider_type == "bge-colbert":
             cls._load_colbert()
+        elif provider_type == "fastembed-small":
+            cls._load_fastembed()
 
-        # Create cache key including device
-        cache_key = f"{provider_type}:{device or 'default'}"
+        # Create cache key including device (local models only)
+        cache_key = cls._cache_key(provider_type, device)
 
         if cache_key not in cls._instances:
             if provider_type not in cls._providers:
@@ -59,13 +73,20 @@ class EmbeddingProviderFactory:
                 raise ValueError(f"Unknown provider: {provider_type}. Available: {available}")
 
             provider_kwargs = kwargs.copy()
-            if device:
+            if device and provider_type not in cls._device_agnostic:
                 provider_kwargs["device"] = device
 
             cls._instances[cache_key] = cls._providers[provider_type](**provider_kwargs)
 
         return cls._instances[cache_key]
 
+    @classmethod
+    def _cache_key(cls, provider_type: str, device: Optional[str]) -> str:
+        """Instance cache key; device only counts for providers that run locally."""
+        if provider_type in cls._device_agnostic:
+            device = None
+        return f"{provider_type}:{device or 'default'}"
+
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[EmbeddingProvider]) -> None:
         """
@@ -90,5 +111,4 @@ class EmbeddingProviderFactory:
     @classmethod
     def is_loaded(cls, provider_type: str, device: Optional[str] = None) -> bool:
         """Check if a provider is already loaded."""
-        cache_key = f"{provider_type}:{device or 'default'}"
-        return cache_key in cls._instances
+        return cls._cache_key(provider_type, device) in cls._instances
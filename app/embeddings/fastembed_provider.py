@@ -0,0 +1,50 @@
+"""Local fastembed (ONNX Runtime) dense provider for structured fields."""
+
+import os
+from typing import List, Optional
+
+from fastembed import TextEmbedding
+
+from .base import EmbeddingProvider
+
+# Model ID constant (fastembed ships the quantized ONNX export of this model)
+FASTEMBED_MODEL_ID = "BAAI/bge-small-en-v1.5"
+
+
+class FastEmbedProvider(EmbeddingProvider):
+    """BGE-small (384 dimensions) running in-process via fastembed."""
+
+    __slots__ = ("_model", "model_id", "dimensions")
+
+    def __init__(self, model: str = FASTEMBED_MODEL_ID, device: Optional[str] = None):
+        """
+        Initialize fastembed provider.
+
+        Uses HF_HOME environment variable for model cache location.
+
+        Args:
+            model: fastembed model name
+            device: Device to use (cpu, cuda); anything else runs on CPU
+        """
+        cache_dir = os.environ.get("HF_HOME", os.environ.get("TRANSFORMERS_CACHE"))
+        providers = ["CUDAExecutionProvider"] if device == "cuda" else None
+
+        self._model = TextEmbedding(model_name=model, cache_dir=cache_dir, providers=providers)
+        self.model_id = model
+        self.dimensions = 384
+
+    def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts in one ONNX run.
+
+        Empty strings get zero vectors, matching the OpenAI provider.
+        """
+        results = [[0.0] * self.dimensions for _ in texts]
+        non_empty = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
+        if not non_empty:
+            return results
+
+        embeddings = self._model.embed([text for _, text in non_empty])
+        for (idx, _), embedding in zip(non_empty, embeddings):
+            results[idx] = embedding.tolist()
+        return results
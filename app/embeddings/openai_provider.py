@@ -1,11 +1,11 @@
 """OpenAI embedding provider for structured fields."""
 
 import logging
-from typing import List, Optional
-
-from openai import OpenAI
+from typing import Any, List, Optional, Tuple
 
+from ..cache import LRUCache
 from ..config import get_settings
+from ..openai_clients import get_async_openai_client, get_openai_client
 from .base import EmbeddingProvider
 
 logger = logging.getLogger(__name__)
@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """OpenAI text-embedding-3-small provider (1536 dimensions)."""
 
+    __slots__ = ("_api_key", "_client", "_async_client", "_cache", "model_id", "dimensions")
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -34,59 +36,75 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         if not self._api_key:
             raise ValueError("OpenAI API key required for embeddings")
 
-        self._client = OpenAI(api_key=self._api_key)
-        self._model = model
-        self._dimensions = 1536
-
-    @property
-    def model_id(self) -> str:
-        return self._model
-
-    @property
-    def dimensions(self) -> int:
-        return self._dimensions
-
-    @property
-    def is_late_interaction(self) -> bool:
-        return False
-
-    def embed(self, text: str) -> List[float]:
-        """Generate embedding for a single text."""
-        if not text or not text.strip():
-            return [0.0] * self._dimensions
-
-        response = self._client.embeddings.create(
-            input=text,
-            model=self._model,
-        )
-        # Log token usage
-        logger.info(f"Embeddings API - Total tokens: {response.usage.total_tokens}")
-        return response.data[0].embedding
+        self._client = get_openai_client(self._api_key)
+        self._async_client = get_async_openai_client(self._api_key)
+        self.model_id = model
+        self.dimensions = 1536
+        # text → embedding; search queries repeat heavily (and /parse then /search
+        # embeds the same strings twice)
+        self._cache: LRUCache[List[float]] = LRUCache(settings.embedding_cache_size)
 
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for multiple texts."""
-        if not texts:
-            return []
-
-        # Handle empty strings
-        non_empty_indices = []
-        non_empty_texts = []
-        for i, text in enumerate(texts):
-            if text and text.strip():
-                non_empty_indices.append(i)
-                non_empty_texts.append(text)
-
-        # Initialize results with zero vectors
-        results = [[0.0] * self._dimensions for _ in range(len(texts))]
+        """
+        Generate embeddings for multiple texts in a single API call.
 
-        if non_empty_texts:
+        Empty strings are not sent to OpenAI; their slots are filled with
+        zero vectors so the output stays aligned with the input order.
+        Previously seen texts are served from the embedding cache.
+        """
+        results, missing = self._lookup(texts)
+        if missing:
             response = self._client.embeddings.create(
-                input=non_empty_texts,
-                model=self._model,
+                input=[text for _, text in missing],
+                model=self.model_id,
+            )
+            self._collect(results, missing, response)
+        return results
+
+    async def aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        """Async `embed_batch` using the AsyncOpenAI client (doesn't block the event loop)."""
+        results, missing = self._lookup(texts)
+        if missing:
+            response = await self._async_client.embeddings.create(
+                input=[text for _, text in missing],
+                model=self.model_id,
             )
-            # Log token usage
-            logger.info(f"Embeddings API - Total tokens: {response.usage.total_tokens}")
-            for idx, embedding_data in zip(non_empty_indices, response.data):
-                results[idx] = embedding_data.embedding
+            self._collect(results, missing, response)
+        return results
+
+    def _lookup(
+        self,
+        texts: List[str],
+    ) -> Tuple[List[List[float]], List[Tuple[int, str]]]:
+        """
+        Resolve texts from the cache.
+
+        Returns:
+            Tuple of (results with zero vectors for empty texts and cached
+            embeddings filled in, (index, text) pairs still to embed)
+        """
+        results = []
+        missing = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results.append([0.0] * self.dimensions)
+                continue
+            cached = self._cache.get(text)
+            if cached is None:
+                missing.append((i, text))
+            results.append(cached)
+        return results, missing
+
+    def _collect(
+        self,
+        results: List[List[float]],
+        missing: List[Tuple[int, str]],
+        response: Any,
+    ) -> None:
+        """Scatter API results into their input slots and cache them."""
+        # Log token usage
+        logger.debug("Embeddings API - Total tokens: %d", response.usage.total_tokens)
 
-        return results
\ No newline at end of file
+        for (idx, text), embedding_data in zip(missing, response.data):
+            results[idx] = embedding_data.embedding
+            self._cache.put(text, embedding_data.embedding)
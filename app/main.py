@@ -1,6 +1,8 @@
 """FastAPI application entry point."""
 
 import logging
+import logging.handlers
+import queue
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -9,13 +11,22 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from .api import router
-from .api.dependencies import get_vector_store, warmup_services
+from .api.dependencies import init_services, warmup_services
+from .api.responses import ORJSONResponse
 from .config import get_settings
 
-# Configure logging
+# Configure logging. Records are pushed onto a queue and written to stderr by
+# a listener thread, so log I/O never blocks request coroutines on the loop.
+# The QueueHandler formats records as they're enqueued; the listener's stream
+# handler just writes the already-formatted message.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(), respect_handler_level=True
+)
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
 logger = logging.getLogger(__name__)
 
@@ -28,13 +39,16 @@ logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
+    _log_listener.start()
     logger.info("Starting Verona AI Search service...")
     logger.info("Using OpenAI embeddings + ColBERT")
 
+    # Build service singletons (stored on app.state)
+    init_services(app)
+
     # Ensure collection exists
     try:
-        vector_store = get_vector_store()
-        created = vector_store.create_collection(recreate=False)
+        created = app.state.vector_store.create_collection(recreate=False)
         if created:
             logger.info("Created Qdrant collection")
         else:
@@ -45,7 +59,7 @@ async def lifespan(app: FastAPI):
     # Warmup embedding providers
     try:
         logger.info("Warming up embedding providers...")
-        warmup_services()
+        await warmup_services(app)
         logger.info("Embedding providers ready")
     except Exception as e:
         logger.warning(f"Failed to warmup providers: {e}")
@@ -59,6 +73,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Verona AI Search service...")
+    _log_listener.stop()
 
 
 def create_app() -> FastAPI:
@@ -70,6 +85,7 @@ def create_app() -> FastAPI:
         description="Multi-vector RAG search service for matrimonial profile matching",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware
@@ -115,4 +131,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=3000,
         reload=settings.debug,
+        loop="uvloop",
+        http="httptools",
     )
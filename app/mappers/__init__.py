@@ -1,6 +1,6 @@
 """Domain model to Qdrant mapping layer."""
 
-from .profile_mapper import ProfileMapper, QdrantPointModel
+from .profile_mapper import ProfileMapper, QdrantPointModel, profile_point_id
 from .query_mapper import QueryMapper, QdrantSearchQuery
 
 __all__ = [
@@ -8,4 +8,5 @@ __all__ = [
     "QdrantPointModel",
     "QueryMapper",
     "QdrantSearchQuery",
+    "profile_point_id",
 ]
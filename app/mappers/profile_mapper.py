@@ -1,17 +1,77 @@
 """Profile mapper for domain to Qdrant point conversion."""
 
 import hashlib
+import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from itertools import islice
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Tuple, Union
 
+import numpy as np
+import xxhash
 
-@dataclass
+# Bound once at import; used in the per-profile ID loop
+_xxh128_hexdigest = xxhash.xxh128_hexdigest
+
+
+def _format_uuid(hex_digest: str) -> str:
+    """Format a 32-char hex digest as 8-4-4-4-12."""
+    return f"{hex_digest[:8]}-{hex_digest[8:12]}-{hex_digest[12:16]}-{hex_digest[16:20]}-{hex_digest[20:32]}"
+
+
+@lru_cache(maxsize=131072)
+def _generate_point_id(user_id: str) -> str:
+    """xxh128 point ID behind ProfileMapper.generate_point_id (cached for re-ingests)."""
+    return _format_uuid(_xxh128_hexdigest(user_id.encode()))
+
+
+# uuid5 inputs for profile_point_id: namespace bytes, and the RFC 4122
+# variant nibble (10xx) for each possible hex digit
+_NAMESPACE_DNS_BYTES = uuid.NAMESPACE_DNS.bytes
+_UUID_VARIANT = {c: "89ab"[int(c, 16) & 3] for c in "0123456789abcdef"}
+
+
+@lru_cache(maxsize=131072)
+def profile_point_id(profile_id: str) -> str:
+    """
+    Deterministic Qdrant point ID for a profile id (uuid5 over NAMESPACE_DNS).
+
+    This is the scheme used by the API and IngestService. Cached because the
+    same ids are hashed repeatedly by profile lookups and skip_ids filters.
+    Formats the SHA-1 hex digest directly (version 5 and variant bits set
+    in place), identical to `str(uuid.uuid5(...))` without building a UUID.
+    """
+    d = hashlib.sha1(_NAMESPACE_DNS_BYTES + profile_id.encode()).hexdigest()
+    return f"{d[:8]}-{d[8:12]}-5{d[13:16]}-{_UUID_VARIANT[d[16]]}{d[17:20]}-{d[20:32]}"
+
+
+def _as_vector_array(vector: Union[List[float], List[List[float]], np.ndarray]) -> np.ndarray:
+    """
+    Normalize an embedding to a contiguous float array.
+
+    Lists become float32; float16/float32 arrays (e.g. fp16 ColBERT token
+    matrices) keep their dtype.
+    """
+    if isinstance(vector, np.ndarray) and vector.dtype in (np.float16, np.float32):
+        return np.ascontiguousarray(vector)
+    return np.asarray(vector, dtype=np.float32)
+
+
+@dataclass(slots=True)
 class QdrantPointModel:
-    """Represents a Qdrant point ready for upsert."""
+    """
+    Represents a Qdrant point ready for upsert.
+
+    Vectors are held as numpy arrays (lists are converted on construction);
+    `QdrantVectorStore` converts them to lists only when uploading.
+    """
     id: str
-    vectors: Dict[str, Union[List[float], List[List[float]]]]
+    vectors: Dict[str, Union[List[float], np.ndarray]]
     payload: Dict[str, Any]
 
+    def __post_init__(self):
+        self.vectors = {name: _as_vector_array(vector) for name, vector in self.vectors.items()}
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for Qdrant upsert."""
         return {
@@ -33,7 +93,7 @@ class ProfileMapper:
     """
 
     # Fields that become vectors (require embedding)
-    VECTOR_FIELDS = {
+    VECTOR_FIELDS: ClassVar[Dict[str, str]] = {
         "education": "education_text",
         "profession": "profession_text",
         "interests": "interests_text",
@@ -41,38 +101,65 @@ class ProfileMapper:
     }
 
     # Fields indexed for filtering (stored in payload)
-    FILTER_FIELDS = [
+    FILTER_FIELDS: ClassVar[List[str]] = [
         "age", "gender", "height", "income", "religion",
         "location", "marital_status", "family_type", "food_habits",
         "smoking", "drinking", "religiosity", "fitness", "intent"
     ]
 
     # Fields stored for display (not indexed)
-    DISPLAY_FIELDS = [
+    DISPLAY_FIELDS: ClassVar[List[str]] = [
         "user_id", "name", "education_text", "profession_text",
         "interests_text", "blurb"
     ]
 
+    # Filter + display fields, deduplicated in order (payload keys)
+    PAYLOAD_FIELDS: ClassVar[Tuple[str, ...]] = tuple(dict.fromkeys(FILTER_FIELDS + DISPLAY_FIELDS))
+
     @classmethod
     def generate_point_id(cls, user_id: str) -> str:
         """
         Generate deterministic UUID from user_id.
         Ensures same user always maps to same point ID.
 
+        Uses xxh128 (fixed seed, so stable across processes); the ID only has
+        to be deterministic, not cryptographic. Memoized, since retries and
+        forced updates re-ingest the same user_ids.
+
         Args:
             user_id: User identifier
 
         Returns:
             UUID-formatted string
         """
-        hash_bytes = hashlib.md5(user_id.encode()).hexdigest()
-        return f"{hash_bytes[:8]}-{hash_bytes[8:12]}-{hash_bytes[12:16]}-{hash_bytes[16:20]}-{hash_bytes[20:32]}"
+        return _generate_point_id(user_id)
+
+    @staticmethod
+    def generate_point_ids(user_ids: List[str]) -> List[str]:
+        """
+        Vectorized `generate_point_id` for a batch of user_ids.
+
+        One comprehension with the hasher bound locally, instead of a classmethod
+        call (and its attribute lookups) per profile.
+        """
+        h = _xxh128_hexdigest
+        return [_format_uuid(h(user_id.encode())) for user_id in user_ids]
+
+    @classmethod
+    def generate_point_id_md5(cls, user_id: str) -> str:
+        """
+        Legacy MD5-based point ID (for points written before the xxh128 switch).
+
+        Kept so migration scripts can locate existing script-written points
+        and move them to their `generate_point_id` IDs.
+        """
+        return _format_uuid(hashlib.md5(user_id.encode()).hexdigest())
 
     @classmethod
     def to_qdrant_point(
         cls,
         profile: Dict[str, Any],
-        vectors: Dict[str, Union[List[float], List[List[float]]]]
+        vectors: Dict[str, Union[List[float], np.ndarray]]
     ) -> QdrantPointModel:
         """
         Convert domain profile + embeddings to Qdrant point.
@@ -91,22 +178,22 @@ class ProfileMapper:
         if not user_id:
             raise ValueError("Profile must have user_id")
 
-        point_id = cls.generate_point_id(user_id)
+        return cls._build_point(cls.generate_point_id(user_id), profile, vectors)
 
-        # Build payload (filter fields + display fields)
-        payload = {}
-
-        # Add filter fields
-        for field_name in cls.FILTER_FIELDS:
-            value = profile.get(field_name)
-            if value is not None:
-                payload[field_name] = value
-
-        # Add display fields
-        for field_name in cls.DISPLAY_FIELDS:
-            value = profile.get(field_name)
-            if value is not None:
-                payload[field_name] = value
+    @classmethod
+    def _build_point(
+        cls,
+        point_id: str,
+        profile: Dict[str, Any],
+        vectors: Dict[str, Union[List[float], np.ndarray]]
+    ) -> QdrantPointModel:
+        """Build a QdrantPointModel for a profile whose point ID is already known."""
+        # Build payload (filter fields + display fields, skipping None)
+        payload = {
+            field_name: value
+            for field_name in cls.PAYLOAD_FIELDS
+            if (value := profile.get(field_name)) is not None
+        }
 
         return QdrantPointModel(
             id=point_id,
@@ -125,13 +212,12 @@ class ProfileMapper:
         Returns:
             Domain profile dict with search metadata
         """
-        payload = qdrant_point.get("payload", {})
-
-        return {
-            "id": qdrant_point.get("id"),
-            "score": qdrant_point.get("score"),
-            **payload
-        }
+        # One copy of the payload; payload keys still take precedence over
+        # the point's id/score, as with the previous {**payload} spread
+        profile = dict(qdrant_point.get("payload") or ())
+        profile.setdefault("id", qdrant_point.get("id"))
+        profile.setdefault("score", qdrant_point.get("score"))
+        return profile
 
     @classmethod
     def get_text_for_embedding(cls, profile: Dict[str, Any]) -> Dict[str, str]:
@@ -144,11 +230,15 @@ class ProfileMapper:
         Returns:
             Dict mapping vector_name -> text_content
         """
-        result = {}
-        for vector_name, field_name in cls.VECTOR_FIELDS.items():
-            text = profile.get(field_name, "")
-            result[vector_name] = text if text else ""
-        return result
+        return {
+            vector_name: profile.get(field_name) or ""
+            for vector_name, field_name in cls.VECTOR_FIELDS.items()
+        }
+
+    @classmethod
+    def has_any_text_field(cls, profile: Dict[str, Any]) -> bool:
+        """Check whether any embeddable text field is non-empty (without building the dict)."""
+        return any(profile.get(field_name) for field_name in cls.VECTOR_FIELDS.values())
 
     @classmethod
     def validate_profile(cls, profile: Dict[str, Any]) -> List[str]:
@@ -167,8 +257,7 @@ class ProfileMapper:
             errors.append("Missing required field: user_id")
 
         # Check at least one text field has content
-        text_fields = cls.get_text_for_embedding(profile)
-        if not any(text_fields.values()):
+        if not cls.has_any_text_field(profile):
             errors.append("Profile must have at least one text field for embedding")
 
         return errors
@@ -177,7 +266,7 @@ class ProfileMapper:
     def batch_to_qdrant_points(
         cls,
         profiles: List[Dict[str, Any]],
-        vectors_batch: List[Dict[str, Union[List[float], List[List[float]]]]]
+        vectors_batch: List[Dict[str, Union[List[float], np.ndarray]]]
     ) -> List[QdrantPointModel]:
         """
         Convert batch of profiles to Qdrant points.
@@ -192,9 +281,40 @@ class ProfileMapper:
         if len(profiles) != len(vectors_batch):
             raise ValueError("Profiles and vectors must have same length")
 
-        points = []
-        for profile, vectors in zip(profiles, vectors_batch):
-            point = cls.to_qdrant_point(profile, vectors)
-            points.append(point)
+        # Hash all IDs up front (fails fast on a missing user_id)
+        user_ids = [profile.get("user_id") or "" for profile in profiles]
+        if not all(user_ids):
+            raise ValueError("Profile must have user_id")
+        point_ids = cls.generate_point_ids(user_ids)
+
+        points = [
+            cls._build_point(point_id, profile, vectors)
+            for point_id, profile, vectors in zip(point_ids, profiles, vectors_batch)
+        ]
 
         return points
+
+    @classmethod
+    def iter_qdrant_point_batches(
+        cls,
+        items: Iterable[Tuple[Dict[str, Any], Dict[str, Union[List[float], np.ndarray]]]],
+        batch_size: int = 32,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lazily map (profile, vectors) pairs into fixed-size batches of point dicts.
+
+        Mapping happens only as batches are pulled, so a consumer like
+        `QdrantVectorStore.aupsert_batches` can overlap it with uploads.
+
+        Args:
+            items: Iterable of (profile, vectors) pairs
+            batch_size: Points per batch
+
+        Yields:
+            Lists of point dicts ready for upsert
+        """
+        iterator = iter(items)
+        while chunk := list(islice(iterator, batch_size)):
+            profiles, vectors_batch = zip(*chunk)
+            points = cls.batch_to_qdrant_points(list(profiles), list(vectors_batch))
+            yield [point.to_dict() for point in points]
@@ -1,10 +1,34 @@
 """Query mapper for search query to Qdrant query conversion."""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple, Union
 
+from ..vector_store.filters import FilterBuilder
 
-@dataclass
+# Range filter keys (coerced to int)
+_RANGE_FILTER_KEYS = frozenset({
+    "min_age", "max_age", "min_height", "max_height", "min_income", "max_income",
+})
+
+
+def _coerce_int(value: Any) -> Optional[int]:
+    """Coerce a range filter value to int (None if not numeric)."""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _coerce_array(value: Any) -> Optional[List[Any]]:
+    """Coerce a categorical filter value to a list (None if unsupported type)."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [v for v in value if v]
+    return None
+
+
+@dataclass(slots=True)
 class QdrantSearchQuery:
     """Represents a Qdrant search query."""
     dense_vectors: Dict[str, List[float]] = field(default_factory=dict)
@@ -26,14 +50,15 @@ class QueryMapper:
     """
 
     # Semantic query fields → Vector names
-    QUERY_TO_VECTOR = {
+    QUERY_TO_VECTOR: ClassVar[Dict[str, str]] = {
         "education_query": "education",
         "profession_query": "profession",
         "vibe_report_query": "vibe_report",
     }
+    _QUERY_VECTOR_ITEMS: ClassVar[Tuple[Tuple[str, str], ...]] = tuple(QUERY_TO_VECTOR.items())
 
     # Filter field mappings (API name → Qdrant payload name, filter_type)
-    FILTER_MAPPINGS = {
+    FILTER_MAPPINGS: ClassVar[Dict[str, Tuple[str, str]]] = {
         # Range filters
         "min_age": ("age", "gte"),
         "max_age": ("age", "lte"),
@@ -56,12 +81,15 @@ class QueryMapper:
         "intent": ("intent", "match_any"),
     }
 
-    # All categorical filter keys (all support arrays)
-    ARRAY_FILTER_KEYS = [
-        "gender", "religion", "location", "marital_status",
-        "family_type", "food_habit", "smoking", "drinking",
-        "religiosity", "fitness", "intent"
-    ]
+    # All categorical filter keys (all support arrays), shared with
+    # FilterBuilder so normalization covers every key it matches on
+    ARRAY_FILTER_KEYS: ClassVar[List[str]] = FilterBuilder.ARRAY_FILTER_KEYS
+
+    # Filter key → coercion function (keys not listed pass through unchanged)
+    _NORMALIZERS: ClassVar[Dict[str, Callable[[Any], Any]]] = (
+        dict.fromkeys(_RANGE_FILTER_KEYS, _coerce_int)
+        | dict.fromkeys(ARRAY_FILTER_KEYS, _coerce_array)
+    )
 
     @classmethod
     def extract_semantic_queries(
@@ -77,12 +105,11 @@ class QueryMapper:
         Returns:
             Dict of {vector_name: query_text} for non-empty queries
         """
-        result = {}
-        for query_key, vector_name in cls.QUERY_TO_VECTOR.items():
-            query_text = parsed.get(query_key, "")
-            if query_text and query_text.strip():
-                result[vector_name] = query_text.strip()
-        return result
+        return {
+            vector_name: query_text
+            for query_key, vector_name in cls._QUERY_VECTOR_ITEMS
+            if (query_text := (parsed.get(query_key) or "").strip())
+        }
 
     @classmethod
     def normalize_filters(cls, filters: Dict[str, Any]) -> Dict[str, Any]:
@@ -104,29 +131,19 @@ class QueryMapper:
             return {}
 
         normalized = {}
+        normalizers = cls._NORMALIZERS
 
         for key, value in filters.items():
-            if value is None or value == "" or value == []:
+            # Skip None, "" and [] (but keep 0)
+            if not value and value != 0:
                 continue
 
-            # Handle range filters (convert to int)
-            if key in ["min_age", "max_age", "min_height", "max_height",
-                       "min_income", "max_income"]:
-                try:
-                    normalized[key] = int(value)
-                except (ValueError, TypeError):
-                    continue
-
-            # Handle array filters (all categorical filters)
-            elif key in cls.ARRAY_FILTER_KEYS:
-                if isinstance(value, str):
-                    normalized[key] = [value]
-                elif isinstance(value, list):
-                    normalized[key] = [v for v in value if v]
-
-            # Pass through other values
-            else:
+            coerce = normalizers.get(key)
+            if coerce is None:
+                # Pass through other values
                 normalized[key] = value
+            elif (coerced := coerce(value)) is not None:
+                normalized[key] = coerced
 
         return normalized
 
@@ -3,6 +3,7 @@
 from .requests import (
     ParseRequest,
     SearchRequest,
+    SEARCH_REQUEST_ADAPTER,
 )
 from .responses import (
     ParseResponse,
@@ -22,6 +23,7 @@ __all__ = [
     # Requests
     "ParseRequest",
     "SearchRequest",
+    "SEARCH_REQUEST_ADAPTER",
     # Responses
     "ParseResponse",
     "SearchResult",
@@ -133,4 +133,4 @@ class IngestUserProfile(BaseModel):
     show_case_profile_ids: Optional[List[str]] = Field(None, alias="showCaseProfileIds")
 
     class Config:
-        populate_by_name = True
\ No newline at end of file
+        populate_by_name = True
@@ -3,15 +3,76 @@
 from __future__ import annotations
 
 import hashlib
-from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel
+import xxhash
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
+
+from ..config import get_settings
 
 if TYPE_CHECKING:
     from .ingest import IngestUserProfile
 
 
+@lru_cache(maxsize=1)
+def _cloud_front_url() -> str:
+    """CloudFront base URL, read from settings once per process."""
+    return get_settings().cloud_front_url
+
+
+def _join_pair(first: Optional[str], second: Optional[str], joiner: str) -> Optional[str]:
+    """Return "{first} {joiner} {second}", or whichever part is set (None if neither)."""
+    if first and second:
+        return f"{first} {joiner} {second}"
+    return first or second or None
+
+
+# Days per month (index 1-12); February 29 is checked against leap years
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def compute_age(dob: Optional[str], today: Optional[Tuple[int, int, int]] = None) -> Optional[int]:
+    """
+    Compute age from date of birth string (YYYY-MM-DD format).
+
+    Zero-padded ASCII dates are sliced and range-checked directly, skipping
+    strptime, which dominates per-profile cost on large ingests. Anything
+    else goes through strptime, so the accepted DOBs are exactly strptime's.
+
+    Args:
+        dob: Date of birth (YYYY-MM-DD)
+        today: (year, month, day) to compute against; pass one tuple for a
+            whole batch to avoid a datetime.now() per profile
+
+    Returns:
+        Age in years, or None if the DOB is missing or invalid
+    """
+    if (
+        isinstance(dob, str) and len(dob) == 10 and dob.isascii()
+        and dob[4] == "-" and dob[7] == "-"
+        and dob[0:4].isdigit() and dob[5:7].isdigit() and dob[8:10].isdigit()
+    ):
+        year, month, day = int(dob[0:4]), int(dob[5:7]), int(dob[8:10])
+        if not (year >= 1 and 1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month]):
+            return None
+        if month == 2 and day == 29 and not (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+            return None
+    else:
+        try:
+            birth_date = datetime.strptime(dob, "%Y-%m-%d")
+        except (ValueError, TypeError):
+            return None
+        year, month, day = birth_date.year, birth_date.month, birth_date.day
+
+    if today is None:
+        now = datetime.now()
+        today = (now.year, now.month, now.day)
+    # Subtract one if birthday hasn't occurred yet this year
+    return today[0] - year - ((today[1], today[2]) < (month, day))
+
+
 class PartnerPreference(BaseModel):
     """Partner preference - placeholder for future use."""
     pass
@@ -80,32 +141,90 @@ class User(BaseModel):
     interests: List[str] = []
     photo_collection: List[ProcessedPhoto] = []
 
+    # Hash over COMPARE_FIELDS + education/profession hashes + photos, for the
+    # "nothing changed" fast path of smart updates
+    content_hash: Optional[str] = None
+
+    # Scalar payload fields compared on smart updates (excluding hash fields,
+    # vector text fields, and last_active); photo_collection is compared separately
+    COMPARE_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "first_name", "last_name", "name",
+        "is_circulateable", "is_paused", "test_lead",
+        "gender", "height", "dob", "age", "current_location", "annual_income",
+        "religion", "caste", "fitness", "religiosity", "smoking", "drinking",
+        "family_type", "food_habits", "intent", "open_to_children",
+        "blurb", "interests",
+    )
+
+    # (photo_ids, hash) memo set by VibeService.compute_vibe_input_hash;
+    # private, so it is never part of the payload
+    _vibe_input_hash: Optional[Tuple[Tuple[str, ...], str]] = PrivateAttr(default=None)
+
     @staticmethod
-    def _md5_hash(text: Optional[str]) -> Optional[str]:
-        """Compute MD5 hash of text, returns None if text is None."""
+    def _content_hash(text: Optional[str]) -> Optional[str]:
+        """
+        Compute MD5 hash of text, returns None if text is None.
+
+        Stays MD5 so it matches the education/profession hashes already stored
+        in the collection (a new algorithm would re-embed every profile).
+        """
         if not text:
             return None
         return hashlib.md5(text.encode()).hexdigest()
 
+    @classmethod
+    def _fields_content_hash(cls, fields: Dict[str, Any]) -> str:
+        """xxh128 over the repr of everything a smart update compares."""
+        values = tuple(fields[field] for field in cls.COMPARE_FIELDS)
+        values += (fields["education_hash"], fields["profession_hash"], fields["photo_collection"])
+        return xxhash.xxh128_hexdigest(repr(values).encode())
+
     @staticmethod
-    def _compute_age(dob: str) -> Optional[int]:
-        """Compute age from date of birth string (YYYY-MM-DD format)."""
-        try:
-            birth_date = datetime.strptime(dob, "%Y-%m-%d")
-            today = datetime.now()
-            age = today.year - birth_date.year
-            # Adjust if birthday hasn't occurred yet this year
-            if (today.month, today.day) < (birth_date.month, birth_date.day):
-                age -= 1
-            return age
-        except (ValueError, TypeError):
-            return None
+    def _compute_age(dob: str, today: Optional[Tuple[int, int, int]] = None) -> Optional[int]:
+        """Compute age from date of birth string (see `compute_age`)."""
+        return compute_age(dob, today)
 
     @classmethod
-    def from_ingest_profile(cls, profile: "IngestUserProfile") -> "User":
-        """Create a User from an IngestUserProfile."""
-        from .ingest import IngestUserProfile  # noqa: F811
+    def from_ingest_profile(
+        cls,
+        profile: "IngestUserProfile",
+        today: Optional[Tuple[int, int, int]] = None,
+        cloud_front_url: Optional[str] = None,
+    ) -> "User":
+        """
+        Create a User from an IngestUserProfile.
 
+        Args:
+            profile: Raw ingest profile
+            today: Optional (year, month, day) for age computation, computed once
+                by callers converting a batch
+            cloud_front_url: Photo URL base; defaults to settings.cloud_front_url
+        """
+        return cls(**cls._ingest_fields(profile, today, cloud_front_url))
+
+    @classmethod
+    def from_ingest_profiles(cls, profiles: List["IngestUserProfile"]) -> List["User"]:
+        """
+        Create Users from a batch of IngestUserProfiles.
+
+        Resolves today's date and the CloudFront URL once for the batch and
+        validates all rows in a single TypeAdapter pass.
+        """
+        now = datetime.now()
+        today = (now.year, now.month, now.day)
+        cloud_front_url = _cloud_front_url()
+
+        rows = [cls._ingest_fields(profile, today, cloud_front_url) for profile in profiles]
+        return _USER_LIST_ADAPTER.validate_python(rows)
+
+    @classmethod
+    def _ingest_fields(
+        cls,
+        profile: "IngestUserProfile",
+        today: Optional[Tuple[int, int, int]],
+        cloud_front_url: Optional[str],
+    ) -> Dict[str, Any]:
+        """Extract User field values from an IngestUserProfile."""
         # Compute is_circulateable
         is_paused = profile.pause_details.is_paused if profile.pause_details else False
         is_circulateable = (
@@ -118,8 +237,10 @@ class User(BaseModel):
             and not is_paused
         )
 
-        # Get last_active from app_version_details
+        # Get last_active from app_version_details (always tz-aware, naive = UTC)
         last_active = profile.app_version_details.last_updated_on
+        if last_active is not None and last_active.tzinfo is None:
+            last_active = last_active.replace(tzinfo=timezone.utc)
 
         # Build profession string from professional journey details
         profession = cls._build_profession(profile)
@@ -128,14 +249,14 @@ class User(BaseModel):
         education = cls._build_education(profile)
 
         # Build photo collection with CloudFront URLs
-        photo_collection = cls._build_photo_collection(profile)
+        photo_collection = cls._build_photo_collection(profile, cloud_front_url)
 
         # Build name if not provided
         name = profile.name
         if not name and (profile.first_name or profile.last_name):
             name = f"{profile.first_name or ''} {profile.last_name or ''}".strip()
 
-        return cls(
+        fields = dict(
             id=profile.id,
             first_name=profile.first_name,
             last_name=profile.last_name,
@@ -148,7 +269,7 @@ class User(BaseModel):
             gender=profile.gender,
             height=profile.height,
             dob=profile.dob,
-            age=cls._compute_age(profile.dob),
+            age=cls._compute_age(profile.dob, today),
             current_location=profile.current_location,
             annual_income=profile.annual_income,
             # Filter fields
@@ -164,9 +285,9 @@ class User(BaseModel):
             open_to_children=profile.open_to_children,
             # Derived fields with hashes
             profession=profession,
-            profession_hash=cls._md5_hash(profession),
+            profession_hash=cls._content_hash(profession),
             education=education,
-            education_hash=cls._md5_hash(education),
+            education_hash=cls._content_hash(education),
             vibe_report=None,  # Not in IngestUserProfile yet
             vibe_report_hash=None,
             # Content fields
@@ -174,6 +295,8 @@ class User(BaseModel):
             blurb=profile.blurb,
             photo_collection=photo_collection,
         )
+        fields["content_hash"] = cls._fields_content_hash(fields)
+        return fields
 
     @classmethod
     def _build_profession(cls, profile: "IngestUserProfile") -> Optional[str]:
@@ -185,35 +308,22 @@ class User(BaseModel):
 
         Note: Uses *Other fields if they exist, otherwise falls back to regular fields.
         """
-        if not profile.professional_journey_details:
+        details = profile.professional_journey_details
+        if not details:
             return None
 
-        # Find the highlighted detail or use the last one
-        selected_detail = None
-        if profile.highlighted_professional_detail_id:
-            for detail in profile.professional_journey_details:
-                if detail.id == profile.highlighted_professional_detail_id:
-                    selected_detail = detail
-                    break
-
-        if not selected_detail:
-            selected_detail = profile.professional_journey_details[-1]
+        # Highlighted detail (first with that id) if set and present, else the last one
+        highlighted_id = profile.highlighted_professional_detail_id
+        selected = (
+            highlighted_id and next((d for d in details if d.id == highlighted_id), None)
+        ) or details[-1]
 
         # Use *Other fields if they exist, otherwise fall back to regular fields
-        designation = selected_detail.designation_other or selected_detail.designation
-        company = selected_detail.company_other or selected_detail.company
-
-        # Build the string
-        parts = []
-        if designation:
-            parts.append(designation)
-        if company:
-            if parts:
-                parts.append(f"at {company}")
-            else:
-                parts.append(company)
-
-        return " ".join(parts) if parts else None
+        return _join_pair(
+            selected.designation_other or selected.designation,
+            selected.company_other or selected.company,
+            "at",
+        )
 
     @classmethod
     def _build_education(cls, profile: "IngestUserProfile") -> Optional[str]:
@@ -227,23 +337,20 @@ class User(BaseModel):
         if not profile.education_details:
             return None
 
-        parts = []
-        for edu in profile.education_details:
-            # Use *Other fields if they exist, otherwise fall back to regular fields
-            degree = edu.degree_other or edu.degree
-            college = edu.college_other or edu.college
-
-            if degree and college:
-                parts.append(f"{degree} from {college}")
-            elif degree:
-                parts.append(degree)
-            elif college:
-                parts.append(college)
-
+        # Use *Other fields if they exist, otherwise fall back to regular fields
+        parts = [
+            part
+            for edu in profile.education_details
+            if (part := _join_pair(edu.degree_other or edu.degree, edu.college_other or edu.college, "from"))
+        ]
         return "; ".join(parts) if parts else None
 
     @classmethod
-    def _build_photo_collection(cls, profile: "IngestUserProfile") -> List[ProcessedPhoto]:
+    def _build_photo_collection(
+        cls,
+        profile: "IngestUserProfile",
+        cloud_front_url: Optional[str] = None,
+    ) -> List[ProcessedPhoto]:
         """
         Build photo collection with CloudFront URLs.
 
@@ -253,32 +360,25 @@ class User(BaseModel):
         - Match by showCaseId OR mediaId (when mediaType is IMAGE_JPEG)
         - Build URLs using CloudFront
         """
-        from ..config import get_settings
-
-        settings = get_settings()
-        cloud_front_url = settings.cloud_front_url
-
         if not profile.photo_collection or not profile.show_case_profile_ids:
             return []
 
-        # Filter out removed photos
+        # Index non-removed photos once instead of scanning per showcase id.
+        # Built from the end so the first matching photo wins, as before.
         photos = [p for p in profile.photo_collection if not p.is_removed]
+        by_showcase_id = {p.show_case_id: p for p in reversed(photos) if p.show_case_id}
+        by_media_id = {
+            p.media_id: p for p in reversed(photos)
+            if p.media_id and p.media_type == "IMAGE_JPEG"
+        }
+
+        if cloud_front_url is None:
+            cloud_front_url = _cloud_front_url()
 
         processed_photos = []
         for showcase_id in profile.show_case_profile_ids:
-            # Try to match by showCaseId first
-            matched_photo = next(
-                (p for p in photos if p.show_case_id == showcase_id),
-                None
-            )
-
-            # If not found, try to match by mediaId where mediaType is IMAGE_JPEG
-            if not matched_photo:
-                matched_photo = next(
-                    (p for p in photos
-                     if p.media_id == showcase_id and p.media_type == "IMAGE_JPEG"),
-                    None
-                )
+            # Match by showCaseId first, then by mediaId for IMAGE_JPEG
+            matched_photo = by_showcase_id.get(showcase_id) or by_media_id.get(showcase_id)
 
             if matched_photo and matched_photo.key:
                 # Use cropped_key if it exists, otherwise fall back to key
@@ -291,3 +391,7 @@ class User(BaseModel):
                 ))
 
         return processed_photos
+
+
+# Reused by User.from_ingest_profiles (schema built once at import)
+_USER_LIST_ADAPTER = TypeAdapter(List[User])
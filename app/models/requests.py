@@ -1,17 +1,61 @@
 """Request models for API endpoints."""
 
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import TypedDict
+
+# Categorical filters accept a single code or a list of codes (match any)
+CategoricalFilter = Optional[Union[str, List[str]]]
+
+
+class FiltersPayload(TypedDict, total=False):
+    """
+    Hard filters accepted by /search (see FilterBuilder for semantics).
+
+    Unknown keys are passed through (and ignored by the filter builder), as
+    they were when filters was a plain dict.
+    """
+    __pydantic_config__ = ConfigDict(extra="allow")
+
+    # Range filters
+    min_age: Optional[int]
+    max_age: Optional[int]
+    min_height: Optional[int]
+    max_height: Optional[int]
+    min_income: Optional[float]  # LPA; QueryMapper.normalize_filters truncates to int
+    max_income: Optional[float]
+
+    # MatchAny filters
+    gender: CategoricalFilter
+    religion: CategoricalFilter
+    location: CategoricalFilter
+    marital_status: CategoricalFilter
+    family_type: CategoricalFilter
+    food_habit: CategoricalFilter
+    smoking: CategoricalFilter
+    drinking: CategoricalFilter
+    religiosity: CategoricalFilter
+    fitness: CategoricalFilter
+    intent: CategoricalFilter
+    caste: CategoricalFilter
+    open_to_children: CategoricalFilter
+
+    # Boolean filters
+    test_lead: Optional[bool]
 
 
 class ParseRequest(BaseModel):
     """Request to parse a natural language query."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     query: str = Field(..., min_length=1, description="Natural language search query")
 
 
 class SearchRequest(BaseModel):
     """Request to execute a search."""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     # Raw query (will be parsed if no parsed_queries provided)
     query: Optional[str] = Field(None, description="Natural language query to auto-parse")
 
@@ -22,9 +66,9 @@ class SearchRequest(BaseModel):
     )
 
     # Hard filters
-    filters: Optional[Dict[str, Any]] = Field(
+    filters: Optional[FiltersPayload] = Field(
         None,
-        description="Filter conditions (genders, religions, min_age, etc.)"
+        description="Filter conditions (gender, religion, min_age, etc.)"
     )
 
     # Pagination
@@ -36,3 +80,8 @@ class SearchRequest(BaseModel):
 
     # IDs to skip
     skip_ids: Optional[List[str]] = Field(None, description="Profile IDs to exclude from results")
+
+
+# Validator for building a SearchRequest from plain dicts outside FastAPI's
+# body parsing (GET /search); schema compiled once at import
+SEARCH_REQUEST_ADAPTER = TypeAdapter(SearchRequest)
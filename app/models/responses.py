@@ -3,11 +3,16 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# Response models are built once and never mutated
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class ProcessedPhotoResponse(BaseModel):
     """Processed photo in search results."""
+    model_config = _RESPONSE_CONFIG
+
     show_case_id: str
     url: str
     cropped_url: Optional[str] = None
@@ -15,6 +20,8 @@ class ProcessedPhotoResponse(BaseModel):
 
 class SearchResultPayload(BaseModel):
     """Typed payload for search results."""
+    model_config = _RESPONSE_CONFIG
+
     id: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
@@ -58,6 +65,8 @@ class SearchResultPayload(BaseModel):
 
 class ParseResponse(BaseModel):
     """Response from query parsing."""
+    model_config = _RESPONSE_CONFIG
+
     original_query: str
     filters: Dict[str, Any]
     education_query: str
@@ -67,6 +76,8 @@ class ParseResponse(BaseModel):
 
 class SearchResult(BaseModel):
     """Individual search result."""
+    model_config = _RESPONSE_CONFIG
+
     id: str
     score: float
     payload: SearchResultPayload
@@ -74,6 +85,8 @@ class SearchResult(BaseModel):
 
 class FilterImpact(BaseModel):
     """Impact of a single filter on results."""
+    model_config = _RESPONSE_CONFIG
+
     filter: str
     value: Any
     count_with: int
@@ -84,6 +97,8 @@ class FilterImpact(BaseModel):
 
 class FilterAnalysis(BaseModel):
     """Analysis of filter impacts on search results."""
+    model_config = _RESPONSE_CONFIG
+
     impacts: List[FilterImpact]
     recommendations: List[str]
     total_without_filters: int
@@ -92,6 +107,8 @@ class FilterAnalysis(BaseModel):
 
 class SearchResponse(BaseModel):
     """Response from search."""
+    model_config = _RESPONSE_CONFIG
+
     query: Optional[str] = None
     parsed: Optional[Dict[str, str]] = None
     results: List[SearchResult]
@@ -105,12 +122,16 @@ class SearchResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """Health check response."""
+    model_config = _RESPONSE_CONFIG
+
     status: str
     timestamp: float
 
 
 class CollectionInfoResponse(BaseModel):
     """Collection information response."""
+    model_config = _RESPONSE_CONFIG
+
     name: str
     points_count: int
     vectors_count: Optional[int] = None
@@ -0,0 +1,22 @@
+"""Process-wide OpenAI clients shared by services and providers."""
+
+from functools import lru_cache
+
+from openai import AsyncOpenAI, OpenAI
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Sync OpenAI client for an API key, created once per process.
+
+    Sharing it means the vibe service and the embedding provider reuse one
+    keep-alive connection pool instead of each warming up their own.
+    """
+    return OpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=None)
+def get_async_openai_client(api_key: str) -> AsyncOpenAI:
+    """Async OpenAI client for an API key, shared by the query parser and embeddings."""
+    return AsyncOpenAI(api_key=api_key)
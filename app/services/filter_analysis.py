@@ -1,13 +1,44 @@
 """Filter analysis service for identifying restrictive filters."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, Hashable, List, NamedTuple, Optional, Tuple
 
+from ..cache import LRUCache
+from ..config import get_settings
 from ..vector_store import QdrantVectorStore, FilterBuilder
 
 logger = logging.getLogger(__name__)
 
 
+class FilterImpactRow(NamedTuple):
+    """Impact of a single filter (same fields as `models.responses.FilterImpact`)."""
+    filter: str
+    value: Any
+    count_with: int
+    count_without: int
+    removed_count: int
+    impact_percentage: float
+
+
+# Sort key for impacts: removed_count by index
+_REMOVED_COUNT = itemgetter(4)
+
+
+def _hashable(value: Any) -> Hashable:
+    """Convert a filter value (scalar or list) into a hashable equivalent."""
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return frozenset((k, _hashable(v)) for k, v in value.items())
+    return value
+
+
+def _freeze_filters(filters: Optional[Dict[str, Any]]) -> FrozenSet[Tuple[str, Hashable]]:
+    """Canonical, order-independent key for a filter dict."""
+    return frozenset((k, _hashable(v)) for k, v in (filters or {}).items())
+
+
 class FilterAnalysisService:
     """
     Analyzes filter impact on search results.
@@ -24,6 +55,12 @@ class FilterAnalysisService:
             vector_store: Qdrant vector store instance
         """
         self.vector_store = vector_store
+        # Analyses keyed by _freeze_filters(filters); cardinalities drift
+        # slowly, so a short TTL bounds staleness
+        settings = get_settings()
+        self._impact_cache: LRUCache[Dict[str, Any]] = LRUCache(
+            settings.filter_analysis_cache_size, ttl=settings.filter_analysis_cache_ttl
+        )
 
     def analyze_filter_impact(
         self,
@@ -33,12 +70,16 @@ class FilterAnalysisService:
         """
         Analyze impact of each filter on result count.
 
+        Results for the same filters (in any key order) are cached for
+        filter_analysis_cache_ttl seconds when no base_count is given.
+
         Args:
             filters: Current filter dict
             base_count: Optional pre-computed base count (without filters)
 
         Returns:
-            Dict with filter impact analysis
+            Dict with filter impact analysis ("impacts" holds FilterImpactRow
+            tuples; use `_asdict()` where dicts are needed)
         """
         if not filters:
             return {
@@ -47,38 +88,62 @@ class FilterAnalysisService:
                 "total_without_filters": base_count or self.vector_store.count(),
             }
 
-        # Get total count without filters
-        total = base_count if base_count is not None else self.vector_store.count()
+        if base_count is not None:
+            return self._analyze(filters, base_count)
+
+        key = _freeze_filters(filters)
+        analysis = self._impact_cache.get(key)
+        if analysis is None:
+            analysis = self._analyze(filters, None)
+            self._impact_cache.put(key, analysis)
+        # Fresh lists so callers can't mutate the cached entry (rows are tuples)
+        return {
+            **analysis,
+            "impacts": list(analysis["impacts"]),
+            "recommendations": list(analysis["recommendations"]),
+        }
 
-        # Get count with all filters
-        current_count = self.vector_store.count(filters)
+    def _analyze(self, filters: Dict[str, Any], base_count: Optional[int]) -> Dict[str, Any]:
+        """Run the counts behind analyze_filter_impact (filters non-empty)."""
+        # Count with all filters and (unless given) without any filters
+        counts = self._count_many([filters] if base_count is not None else [filters, None])
+        current_count = counts[0]
+        total = base_count if base_count is not None else counts[1]
+
+        filter_keys = list(filters)
+        if current_count == total:
+            # No filter removes anything: every count_without is the total,
+            # so skip the per-filter counts
+            counts_without = [total] * len(filter_keys)
+        else:
+            # Count without each filter in one concurrent batch. Removing the
+            # only filter leaves no filters, so that count is the total.
+            filters_without_each = [
+                {k: v for k, v in filters.items() if k != filter_key}
+                for filter_key in filter_keys
+            ]
+            remaining = iter(self._count_many([f for f in filters_without_each if f]))
+            counts_without = [next(remaining) if f else total for f in filters_without_each]
 
         # Analyze each filter's impact
-        impacts = []
-        for filter_key in filters:
-            # Create filter dict without this filter
-            filters_without = {k: v for k, v in filters.items() if k != filter_key}
-
-            # Get count without this filter
-            count_without = self.vector_store.count(filters_without) if filters_without else total
-
-            # Calculate impact
-            impact = {
-                "filter": filter_key,
-                "value": filters[filter_key],
-                "count_with": current_count,
-                "count_without": count_without,
-                "removed_count": count_without - current_count,
-                "impact_percentage": round(
+        impacts = [
+            FilterImpactRow(
+                filter_key,
+                filters[filter_key],
+                current_count,
+                count_without,
+                count_without - current_count,
+                round(
                     ((count_without - current_count) / count_without * 100)
                     if count_without > 0 else 0,
                     1
                 ),
-            }
-            impacts.append(impact)
+            )
+            for filter_key, count_without in zip(filter_keys, counts_without)
+        ]
 
         # Sort by impact (most restrictive first)
-        impacts.sort(key=lambda x: x["removed_count"], reverse=True)
+        impacts.sort(key=_REMOVED_COUNT, reverse=True)
 
         # Generate recommendations
         recommendations = self._generate_recommendations(impacts, current_count, total)
@@ -90,9 +155,26 @@ class FilterAnalysisService:
             "current_count": current_count,
         }
 
+    def _count_many(self, filters_list: List[Optional[Dict[str, Any]]]) -> List[int]:
+        """
+        Count each filter dict, issuing one request per distinct filter set.
+
+        Filter dicts are memoized by canonical key for the duration of the
+        call, so equivalent sets (in any key order) are only counted once.
+        """
+        unique: Dict[FrozenSet[Tuple[str, Hashable]], Optional[Dict[str, Any]]] = {}
+        keys = []
+        for filters in filters_list:
+            key = _freeze_filters(filters)
+            unique.setdefault(key, filters)
+            keys.append(key)
+
+        counts = dict(zip(unique, self.vector_store.count_batch(list(unique.values()))))
+        return [counts[key] for key in keys]
+
     def _generate_recommendations(
         self,
-        impacts: List[Dict[str, Any]],
+        impacts: List[FilterImpactRow],
         current_count: int,
         total: int,
     ) -> List[str]:
@@ -103,18 +185,18 @@ class FilterAnalysisService:
             # No results - suggest removing most restrictive filter
             most_restrictive = impacts[0]
             recommendations.append(
-                f"Try removing the '{most_restrictive['filter']}' filter "
-                f"(currently set to {most_restrictive['value']}) - "
-                f"this would show {most_restrictive['count_without']} profiles"
+                f"Try removing the '{most_restrictive.filter}' filter "
+                f"(currently set to {most_restrictive.value}) - "
+                f"this would show {most_restrictive.count_without} profiles"
             )
 
         elif current_count < 10 and impacts:
             # Few results - suggest relaxing filters
             for impact in impacts[:2]:  # Top 2 most restrictive
-                if impact["impact_percentage"] > 50:
+                if impact.impact_percentage > 50:
                     recommendations.append(
-                        f"The '{impact['filter']}' filter is removing "
-                        f"{impact['impact_percentage']}% of potential matches"
+                        f"The '{impact.filter}' filter is removing "
+                        f"{impact.impact_percentage}% of potential matches"
                     )
 
         return recommendations
@@ -127,22 +209,27 @@ class FilterAnalysisService:
         """
         Get count of profiles for each value of a categorical field.
 
+        One server-side facet request instead of a count per value.
+
         Args:
-            field: Field name (e.g., "gender", "religion")
+            field: Field name (e.g., "gender", "religion"); API filter keys
+                such as "location" are mapped to their payload field
             filters: Optional base filters to apply
 
         Returns:
             Dict of {value: count}
         """
-        # This would require aggregation queries not directly supported by Qdrant
-        # For now, return empty dict - could be implemented with scroll
-        logger.warning(f"get_filter_value_counts not fully implemented for field: {field}")
-        return {}
+        payload_field = FilterBuilder.MATCH_ANY_FIELDS.get(field, field)
+        return {
+            str(value): count
+            for value, count in self.vector_store.facet(payload_field, filters).items()
+        }
 
     def suggest_filter_expansions(
         self,
         filters: Dict[str, Any],
         min_results: int = 10,
+        analysis: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Suggest filter modifications to achieve minimum results.
@@ -150,11 +237,14 @@ class FilterAnalysisService:
         Args:
             filters: Current filters
             min_results: Minimum desired results
+            analysis: Result of analyze_filter_impact(filters), if the caller
+                already has it (skips recomputing every count)
 
         Returns:
             List of suggested filter modifications
         """
-        analysis = self.analyze_filter_impact(filters)
+        if analysis is None:
+            analysis = self.analyze_filter_impact(filters)
 
         if analysis["current_count"] >= min_results:
             return []
@@ -166,12 +256,12 @@ class FilterAnalysisService:
             if cumulative_count >= min_results:
                 break
 
-            if impact["count_without"] > cumulative_count:
+            if impact.count_without > cumulative_count:
                 suggestions.append({
                     "action": "remove",
-                    "filter": impact["filter"],
-                    "expected_count": impact["count_without"],
+                    "filter": impact.filter,
+                    "expected_count": impact.count_without,
                 })
-                cumulative_count = impact["count_without"]
+                cumulative_count = impact.count_without
 
         return suggestions
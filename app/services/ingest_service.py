@@ -1,14 +1,16 @@
 """Ingest service for profile ingestion into Qdrant."""
 
 import logging
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import get_settings
+from ..config.embedding_specs import PROVIDER_BY_VECTOR
 
 logger = logging.getLogger(__name__)
-from ..embeddings import EmbeddingProviderFactory
+from ..embeddings import EmbeddingProvider, EmbeddingProviderFactory
+from ..mappers import profile_point_id
 from ..models.ingest import IngestUserProfile
 from ..models.object import User
 from ..vector_store import QdrantVectorStore
@@ -20,8 +22,13 @@ class IngestService:
 
     def __init__(self, vector_store: QdrantVectorStore):
         self.vector_store = vector_store
-        self.device = get_settings().embedding_device
+        settings = get_settings()
+        self.device = settings.embedding_device
+        # Vibe maps (OpenAI requests) generated at once per batch
+        self.vibe_concurrency = max(1, settings.openai_concurrency)
         self._vibe_service: Optional[VibeService] = None
+        self._dense_provider: Optional[EmbeddingProvider] = None
+        self._colbert_provider: Optional[EmbeddingProvider] = None
 
     @property
     def vibe_service(self) -> VibeService:
@@ -30,9 +37,79 @@ class IngestService:
             self._vibe_service = VibeService()
         return self._vibe_service
 
+    @property
+    def dense_provider(self) -> EmbeddingProvider:
+        """Lazy-load dense provider for education/profession vectors."""
+        if self._dense_provider is None:
+            self._dense_provider = EmbeddingProviderFactory.get_provider(
+                PROVIDER_BY_VECTOR["education"], device=self.device
+            )
+        return self._dense_provider
+
+    @property
+    def colbert_provider(self) -> EmbeddingProvider:
+        """Lazy-load ColBERT provider (only needed once a vibe report exists)."""
+        if self._colbert_provider is None:
+            self._colbert_provider = EmbeddingProviderFactory.get_provider(
+                PROVIDER_BY_VECTOR["vibe_report"], device=self.device
+            )
+        return self._colbert_provider
+
     def _get_point_id(self, profile_id: str) -> str:
         """Generate deterministic point ID from profile id."""
-        return str(uuid.uuid5(uuid.NAMESPACE_DNS, profile_id))
+        return profile_point_id(profile_id)
+
+    def _embed_dense_batch(self, texts_list: List[Dict[str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """
+        Embed the non-empty texts of several profiles with one dense batch call.
+
+        Args:
+            texts_list: {vector_name: text} per profile; empty/None texts are skipped
+
+        Returns:
+            {vector_name: embedding} per profile, for its non-empty texts
+        """
+        pending = [
+            (i, name, text)
+            for i, texts in enumerate(texts_list)
+            for name, text in texts.items()
+            if text
+        ]
+        results: List[Dict[str, Any]] = [{} for _ in texts_list]
+        if not pending:
+            return results
+        embeddings = self.dense_provider.embed_batch([text for _, _, text in pending])
+        for (i, name, _), embedding in zip(pending, embeddings):
+            results[i][name] = embedding
+        return results
+
+    @staticmethod
+    def _flatten_dedup_tags(image_tags: List[Dict[str, Any]]) -> List[str]:
+        """Flatten imageTags[*].tags into one list, dropping duplicates (order preserved)."""
+        seen = set()
+        ordered = []
+        for item in image_tags:
+            tags = item.get("tags")
+            if not isinstance(tags, list):
+                continue
+            for tag in tags:
+                if tag not in seen:
+                    seen.add(tag)
+                    ordered.append(tag)
+        return ordered
+
+    @staticmethod
+    def _user_payload(user: User) -> Dict[str, Any]:
+        """
+        Shallow payload dict for a User.
+
+        Equivalent to `user.model_dump()` for this model without the recursive
+        serializer: only photo_collection holds sub-models, and datetime values
+        are encoded by qdrant-client.
+        """
+        payload = dict(user.__dict__)
+        payload["photo_collection"] = [dict(photo.__dict__) for photo in user.photo_collection]
+        return payload
 
     def _extract_photo_urls(self, user: User) -> List[Dict[str, str]]:
         """Extract photo URLs from User's processed photo_collection for vibe generation."""
@@ -56,7 +133,7 @@ class IngestService:
         Returns:
             User model with processed data
         """
-        logger.info(f"Ingesting profile: {profile.id}")
+        logger.info("Ingesting profile: %s", profile.id)
         point_id = self._get_point_id(profile.id)
 
         # Convert ingest profile to User model
@@ -69,12 +146,14 @@ class IngestService:
         if not user.is_circulateable:
             if existing is None:
                 # Don't create new non-circulateable profiles
-                logger.info(f"Skipping non-circulateable profile (doesn't exist): {profile.id}")
+                logger.info("Skipping non-circulateable profile (doesn't exist): %s", profile.id)
                 return user
             else:
-                # Update is_circulateable for existing profile
-                logger.info(f"Updating is_circulateable=False for existing profile: {profile.id}")
-                self.vector_store.set_payload(point_id, {"is_circulateable": False})
+                # Update is_circulateable for existing profile. The stored
+                # content_hash is cleared as it no longer describes the point,
+                # so a later reactivation goes through the smart update.
+                logger.info("Updating is_circulateable=False for existing profile: %s", profile.id)
+                self.vector_store.set_payload(point_id, {"is_circulateable": False, "content_hash": None})
                 return user
 
         # Circulateable profile - proceed with normal ingestion
@@ -87,52 +166,107 @@ class IngestService:
 
         return user
 
+    def ingest_batch(self, profiles: List[IngestUserProfile]) -> List[User]:
+        """
+        Ingest many profiles with batched round-trips.
+
+        Same per-profile rules as `ingest`, but with one existence lookup for
+        the whole batch, one dense embed_batch across all pending
+        education/profession texts, vibe maps generated concurrently, one
+        ColBERT batch for the new vibe reports, one upsert for all full
+        upserts and one batch update for all smart updates.
+
+        Returns:
+            User models with processed data (same order as profiles)
+        """
+        if not profiles:
+            return []
+        logger.info("Ingesting batch of %s profiles", len(profiles))
+
+        users = User.from_ingest_profiles(profiles)
+        point_ids = [self._get_point_id(profile.id) for profile in profiles]
+        existing = self.vector_store.get_points(point_ids)
+
+        full: List[Tuple[str, User]] = []
+        smart: List[Tuple[str, User, Dict[str, Any]]] = []
+        payload_updates: Dict[str, Dict[str, Any]] = {}
+        for profile, user, point_id in zip(profiles, users, point_ids):
+            existing_payload = existing.get(point_id)
+            if not user.is_circulateable:
+                if existing_payload is None:
+                    logger.info("Skipping non-circulateable profile (doesn't exist): %s", profile.id)
+                else:
+                    logger.info("Updating is_circulateable=False for existing profile: %s", profile.id)
+                    # Cleared content_hash: see ingest
+                    payload_updates[point_id] = {"is_circulateable": False, "content_hash": None}
+            elif existing_payload is None or profile.force_update_vector_profile:
+                full.append((point_id, user))
+            elif self._is_unchanged(user, existing_payload):
+                if self._should_update_last_active(user, existing_payload, False):
+                    payload_updates[point_id] = {"last_active": user.last_active}
+            else:
+                smart.append((point_id, user, existing_payload))
+
+        # Payload/vector work per circulateable profile, in full + smart order
+        payloads = [self._user_payload(user) for _, user in full]
+        smart_changes = [self._hash_changes(user, existing_payload) for _, user, existing_payload in smart]
+        payloads.extend(changes for changes, _ in smart_changes)
+        all_users = [user for _, user in full] + [user for _, user, _ in smart]
+
+        # Vibe maps for every full upsert and every smart update without one,
+        # generated while the dense texts are embedded
+        targets = list(range(len(full))) + [
+            len(full) + i for i, (_, _, existing_payload) in enumerate(smart)
+            if not existing_payload.get("vibe_report_hash")
+        ]
+        vectors, vibes = self._embed_dense_with_vibes(
+            [{"education": user.education, "profession": user.profession} for _, user in full]
+            + [dense_texts for _, dense_texts in smart_changes],
+            [all_users[i] for i in targets],
+        )
+        self._apply_vibes([(all_users[i], payloads[i], vectors[i]) for i in targets], vibes)
+
+        # Full upserts: one upsert_points call
+        points = [
+            {"id": point_id, "vectors": point_vectors, "payload": payload}
+            for (point_id, _), payload, point_vectors in zip(full, payloads, vectors)
+            if point_vectors
+        ]
+        if points:
+            self.vector_store.upsert_points(points)
+
+        # Smart updates (and deactivations): one batch update
+        vector_updates: Dict[str, Dict[str, Any]] = {}
+        for (point_id, user, existing_payload), changes, point_vectors in zip(
+            smart, payloads[len(full):], vectors[len(full):]
+        ):
+            self._finish_smart_changes(user, existing_payload, changes, point_vectors)
+            if changes:
+                payload_updates[point_id] = changes
+            if point_vectors:
+                vector_updates[point_id] = point_vectors
+        if payload_updates or vector_updates:
+            self.vector_store.batch_update(payload_updates, vector_updates)
+
+        return users
+
     def _full_upsert(
         self,
         point_id: str,
         user: User,
     ) -> None:
         """Perform full upsert with all vectors."""
-        openai_provider = EmbeddingProviderFactory.get_provider("openai-small", device=self.device)
-        colbert_provider = EmbeddingProviderFactory.get_provider("bge-colbert", device=self.device)
+        payload = self._user_payload(user)
 
-        vectors = {}
-        payload = user.model_dump()
+        # Generate vectors for text fields (dense provider, one batch call)
+        # while the vibe map is generated
+        [vectors], vibes = self._embed_dense_with_vibes(
+            [{"education": user.education, "profession": user.profession}],
+            [user],
+        )
 
-        # Generate vectors for text fields (OpenAI)
-        if user.education:
-            vectors["education"] = openai_provider.embed(user.education)
-        if user.profession:
-            vectors["profession"] = openai_provider.embed(user.profession)
-
-        # Generate vibe report
-        try:
-            photo_urls = self._extract_photo_urls(user)
-            # Compute hash of input payload (for change detection)
-            vibe_input_hash = self.vibe_service.compute_vibe_input_hash(user, photo_urls)
-            vibe_map = self.vibe_service.generate_vibe_map(user, photo_urls)
-            vibe_report = vibe_map.get("vibeReport")
-            if vibe_report:
-                payload["vibe_report"] = vibe_report
-                payload["vibe_report_hash"] = vibe_input_hash  # Hash of input, not output
-                payload["profile_hook"] = vibe_map.get("trumpAdamsSummary")
-                # Extract imageTags and flatten to life_style_tags
-                image_tags = vibe_map.get("imageTags", [])
-                if image_tags:
-                    all_tags = []
-                    for item in image_tags:
-                        tags = item.get("tags", [])
-                        if isinstance(tags, list):
-                            all_tags.extend(tags)
-                    # Remove duplicates while preserving order
-                    payload["life_style_tags"] = list(dict.fromkeys(all_tags))
-                # Generate vibe_report vector (ColBERT for late interaction)
-                vectors["vibe_report"] = colbert_provider.embed(vibe_report)
-                logger.info(f"Vibe report generated: {user.id}")
-            else:
-                logger.warning(f"Vibe map returned no vibeReport: {vibe_map}")
-        except Exception as e:
-            logger.error(f"Vibe generation failed: {e}", exc_info=True)
+        # Add vibe report
+        self._apply_vibes([(user, payload, vectors)], vibes)
 
         if vectors:
             self.vector_store.upsert_points([{
@@ -154,62 +288,71 @@ class IngestService:
         - education (education_hash)
         - profession (profession_hash)
         - vibe_report content (based on education, profession, interests, blurb)
+
+        Skips all of that when the stored content_hash matches (keepalive
+        ingests), leaving only the last_active check.
+        """
+        if self._is_unchanged(user, existing_payload):
+            if self._should_update_last_active(user, existing_payload, False):
+                self.vector_store.set_payload(point_id, {"last_active": user.last_active})
+            return
+
+        payload_updates, dense_texts = self._hash_changes(user, existing_payload)
+
+        # TODO: This will be changed on the basis of a key vibe_report_regenerate_on_hash,
+        # that will signify that even if hash doesn't match but vibe_report hash exists, then skip that
+        # if vibe_input_hash != existing_vibe_hash:
+        vibe_users = [] if existing_payload.get("vibe_report_hash") else [user]
+
+        # Re-embed changed dense fields in one batch call (alongside any vibe map)
+        [vector_updates], vibes = self._embed_dense_with_vibes([dense_texts], vibe_users)
+        self._apply_vibes([(user, payload_updates, vector_updates)] if vibe_users else [], vibes)
+
+        self._finish_smart_changes(user, existing_payload, payload_updates, vector_updates)
+
+        # Apply updates
+        if payload_updates:
+            self.vector_store.set_payload(point_id, payload_updates)
+
+        if vector_updates:
+            self.vector_store.update_vectors(point_id, vector_updates)
+
+    def _hash_changes(
+        self,
+        user: User,
+        existing_payload: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], Dict[str, Optional[str]]]:
         """
-        openai_provider = EmbeddingProviderFactory.get_provider("openai-small", device=self.device)
+        Detect education/profession changes by content hash.
 
+        Returns:
+            (payload_updates, dense_texts to re-embed)
+        """
         payload_updates: Dict[str, Any] = {}
-        vector_updates: Dict[str, Any] = {}
+        dense_texts: Dict[str, Optional[str]] = {}
 
         # Check education changes
-        existing_education_hash = existing_payload.get("education_hash")
-        if user.education_hash != existing_education_hash:
+        if user.education_hash != existing_payload.get("education_hash"):
             payload_updates["education"] = user.education
             payload_updates["education_hash"] = user.education_hash
-            if user.education:
-                vector_updates["education"] = openai_provider.embed(user.education)
+            dense_texts["education"] = user.education
 
         # Check profession changes
-        existing_profession_hash = existing_payload.get("profession_hash")
-        if user.profession_hash != existing_profession_hash:
+        if user.profession_hash != existing_payload.get("profession_hash"):
             payload_updates["profession"] = user.profession
             payload_updates["profession_hash"] = user.profession_hash
-            if user.profession:
-                vector_updates["profession"] = openai_provider.embed(user.profession)
+            dense_texts["profession"] = user.profession
 
-        # Check if vibe report needs to be generated
-        photo_urls = self._extract_photo_urls(user)
-        vibe_input_hash = self.vibe_service.compute_vibe_input_hash(user, photo_urls)
-        existing_vibe_hash = existing_payload.get("vibe_report_hash")
-
-        # TODO: This will be changed on the basis of a key vibe_report_regenerate_on_hash,
-        # that will signify that even if hash doesn't match but vibe_report hash exists, then skip that
-        # if vibe_input_hash != existing_vibe_hash:
-        if not existing_vibe_hash:
-            try:
-                colbert_provider = EmbeddingProviderFactory.get_provider("bge-colbert", device=self.device)
-                vibe_map = self.vibe_service.generate_vibe_map(user, photo_urls)
-                vibe_report = vibe_map.get("vibeReport")
-                if vibe_report:
-                    payload_updates["vibe_report"] = vibe_report
-                    payload_updates["vibe_report_hash"] = vibe_input_hash  # Hash of input, not output
-                    payload_updates["profile_hook"] = vibe_map.get("trumpAdamsSummary")
-                    # Extract imageTags and flatten to life_style_tags
-                    image_tags = vibe_map.get("imageTags", [])
-                    if image_tags:
-                        all_tags = []
-                        for item in image_tags:
-                            tags = item.get("tags", [])
-                            if isinstance(tags, list):
-                                all_tags.extend(tags)
-                        # Remove duplicates while preserving order
-                        payload_updates["life_style_tags"] = list(dict.fromkeys(all_tags))
-                    vector_updates["vibe_report"] = colbert_provider.embed(vibe_report)
-                    logger.info(f"Vibe report regenerated: {user.id}")
-                else:
-                    logger.warning(f"Vibe map returned no vibeReport: {vibe_map}")
-            except Exception as e:
-                logger.error(f"Vibe generation failed: {e}", exc_info=True)
+        return payload_updates, dense_texts
 
+    def _finish_smart_changes(
+        self,
+        user: User,
+        existing_payload: Dict[str, Any],
+        payload_updates: Dict[str, Any],
+        vector_updates: Dict[str, Any],
+    ) -> None:
+        """Add changed non-vector fields and (if due) last_active to payload_updates."""
         # Update other payload fields that might have changed
         payload_updates.update(self._get_payload_diff(user, existing_payload))
 
@@ -218,12 +361,112 @@ class IngestService:
         if self._should_update_last_active(user, existing_payload, has_other_updates):
             payload_updates["last_active"] = user.last_active
 
-        # Apply updates
-        if payload_updates:
-            self.vector_store.set_payload(point_id, payload_updates)
+        # Store the content hash so the next unchanged ingest takes the fast path
+        if user.content_hash != existing_payload.get("content_hash"):
+            payload_updates["content_hash"] = user.content_hash
 
-        if vector_updates:
-            self.vector_store.update_vectors(point_id, vector_updates)
+    @staticmethod
+    def _is_unchanged(user: User, existing_payload: Dict[str, Any]) -> bool:
+        """
+        Whether a smart update would change nothing but last_active.
+
+        True when the content hash matches and the vibe report already exists
+        (a missing one is still generated by the smart update).
+        """
+        return (
+            user.content_hash is not None
+            and user.content_hash == existing_payload.get("content_hash")
+            and bool(existing_payload.get("vibe_report_hash"))
+        )
+
+    def _embed_dense_with_vibes(
+        self,
+        texts_list: List[Dict[str, Optional[str]]],
+        vibe_users: List[User],
+    ) -> Tuple[List[Dict[str, Any]], List[Optional[Dict[str, Any]]]]:
+        """
+        Embed dense texts and generate vibe maps concurrently.
+
+        The vibe maps (multimodal LLM calls, usually the slowest step) run on
+        a bounded thread pool while the dense batch is embedded in the
+        calling thread, so ingest waits for the slower of the two rather
+        than their sum.
+
+        Returns:
+            (`_embed_dense_batch(texts_list)`, `_generate_vibe` per vibe user)
+        """
+        if not vibe_users:
+            return self._embed_dense_batch(texts_list), []
+
+        with ThreadPoolExecutor(max_workers=min(self.vibe_concurrency, len(vibe_users))) as executor:
+            futures = [executor.submit(self._generate_vibe, user) for user in vibe_users]
+            vectors = self._embed_dense_batch(texts_list)
+            vibes = [future.result() for future in futures]
+        return vectors, vibes
+
+    def _apply_vibes(
+        self,
+        targets: List[Tuple[User, Dict[str, Any], Dict[str, Any]]],
+        vibes: List[Optional[Dict[str, Any]]],
+    ) -> None:
+        """
+        Merge generated vibes into their (user, payload, vectors) targets.
+
+        The vibe reports are embedded with one ColBERT batch. Targets whose
+        vibe failed (None) are left unchanged.
+        """
+        generated = [
+            (target, vibe) for target, vibe in zip(targets, vibes) if vibe is not None
+        ]
+        if not generated:
+            return
+
+        try:
+            embeddings = self.colbert_provider.embed_batch(
+                [vibe["vibe_report"] for _, vibe in generated]
+            )
+        except Exception as e:
+            logger.error("Vibe report embedding failed: %s", e, exc_info=True)
+            return
+
+        for ((user, payload, vectors), vibe), embedding in zip(generated, embeddings):
+            payload.update(vibe)
+            vectors["vibe_report"] = embedding
+            logger.info("Vibe report generated: %s", user.id)
+
+    def _generate_vibe(self, user: User) -> Optional[Dict[str, Any]]:
+        """
+        Generate the vibe payload fields for a user.
+
+        Returns:
+            vibe_report/vibe_report_hash/profile_hook (and life_style_tags when
+            the map has image tags), or None if generation failed or returned
+            no report
+        """
+        try:
+            photo_urls = self._extract_photo_urls(user)
+            # Compute hash of input payload (for change detection)
+            vibe_input_hash = self.vibe_service.compute_vibe_input_hash(user, photo_urls)
+            vibe_map = self.vibe_service.generate_vibe_map(user, photo_urls)
+        except Exception as e:
+            logger.error("Vibe generation failed: %s", e, exc_info=True)
+            return None
+
+        vibe_report = vibe_map.get("vibeReport")
+        if not vibe_report:
+            logger.warning("Vibe map returned no vibeReport: %s", vibe_map)
+            return None
+
+        vibe = {
+            "vibe_report": vibe_report,
+            "vibe_report_hash": vibe_input_hash,  # Hash of input, not output
+            "profile_hook": vibe_map.get("trumpAdamsSummary"),
+        }
+        # Extract imageTags and flatten to life_style_tags
+        image_tags = vibe_map.get("imageTags", [])
+        if image_tags:
+            vibe["life_style_tags"] = self._flatten_dedup_tags(image_tags)
+        return vibe
 
     def _get_payload_diff(
         self,
@@ -232,24 +475,19 @@ class IngestService:
     ) -> Dict[str, Any]:
         """Get payload fields that have changed (non-vector fields)."""
         diff = {}
-        user_dict = user.model_dump()
-
-        # Fields to compare (excluding hash fields, vector text fields, and last_active)
-        compare_fields = [
-            "first_name", "last_name", "name",
-            "is_circulateable", "is_paused", "test_lead",
-            "gender", "height", "dob", "age", "current_location", "annual_income",
-            "religion", "caste", "fitness", "religiosity", "smoking", "drinking",
-            "family_type", "food_habits", "intent", "open_to_children",
-            "blurb", "interests", "photo_collection"
-        ]
+        # Read fields straight off the model; only photo_collection needs
+        # converting (payload holds dicts), and only when it differs
+        values = user.__dict__
 
-        for field in compare_fields:
-            new_value = user_dict.get(field)
-            existing_value = existing_payload.get(field)
-            if new_value != existing_value:
+        for field in User.COMPARE_FIELDS:
+            new_value = values[field]
+            if new_value != existing_payload.get(field):
                 diff[field] = new_value
 
+        photos = [dict(photo.__dict__) for photo in user.photo_collection]
+        if photos != existing_payload.get("photo_collection"):
+            diff["photo_collection"] = photos
+
         return diff
 
     def _should_update_last_active(
@@ -272,17 +510,17 @@ class IngestService:
         if existing_last_active is None:
             return True  # No existing value, always update
 
-        # Parse existing last_active if it's a string
+        # Parse existing last_active if it's a string (fromisoformat takes
+        # the "Z" suffix directly on Python 3.11+)
         if isinstance(existing_last_active, str):
             try:
-                existing_last_active = datetime.fromisoformat(existing_last_active.replace("Z", "+00:00"))
+                existing_last_active = datetime.fromisoformat(existing_last_active)
             except ValueError:
                 return True  # Can't parse, update it
 
-        # Ensure both are timezone-aware for comparison
+        # user.last_active is tz-aware from User.from_ingest_profile; older
+        # payloads may hold naive timestamps (UTC)
         new_last_active = user.last_active
-        if new_last_active.tzinfo is None:
-            new_last_active = new_last_active.replace(tzinfo=timezone.utc)
         if existing_last_active.tzinfo is None:
             existing_last_active = existing_last_active.replace(tzinfo=timezone.utc)
 
@@ -1,12 +1,16 @@
 """LLM-based query parser using GPT-4o-mini."""
 
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, Optional
+import re
+from typing import Any, Dict, Optional, Tuple
 
-from openai import OpenAI
+import orjson
 
+from ..cache import LRUCache
 from ..config import get_settings
+from ..openai_clients import get_async_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -98,40 +102,228 @@ SEMANTIC QUERY RULES:
 3. vibe_report_query: Extract hobbies/interests/personality exactly as mentioned, no fluff
    - "loves guitar music and hiking" → "guitar music hiking"
    - "ambitious and caring" → "ambitious caring"
-   - Keep it straightforward, no added words
-
-EXAMPLES:
-
-Query: "IIT graduate software engineer age 25-32 loves guitar and hiking height atleast 150"
-Output:
-- filters: {min_age: 25, max_age: 32, min_height: 59}  (150cm = 59 inches)
-- education_query: "IIT graduate"
-- profession_query: "software engineer"
-- vibe_report_query: "guitar hiking"
-
-Query: "Doctor from Mumbai, caring and empathetic person, height 5'6 to 6'"
-Output:
-- filters: {location: ["IN_MB"], min_height: 66, max_height: 72}
-- education_query: ""
-- profession_query: "doctor"
-- vibe_report_query: "caring empathetic"
-
-Query: "CA or MBA, vegetarian, modern progressive mindset"
-Output:
-- filters: {food_habit: ["VGT"]}
-- education_query: "CA MBA"
-- profession_query: ""
-- vibe_report_query: "modern progressive"
-
-Query: "Hindu girl from Delhi, age 28-35, loves travel and photography"
-Output:
-- filters: {gender: ["female"], religion: ["HI"], location: ["IN_DEL"], min_age: 28, max_age: 35}
-- education_query: ""
-- profession_query: ""
-- vibe_report_query: "travel photography" """
+   - Keep it straightforward, no added words"""
 
 USER_PROMPT_TEMPLATE = """Parse this search query: "{query}" """
 
+# Filter keys in schema order (every one is present in a strict response)
+_FILTER_KEYS = tuple(QUERY_PARSER_SCHEMA["schema"]["properties"]["filters"]["required"])
+
+
+def _few_shot(
+    query: str,
+    filters: Dict[str, Any],
+    education_query: str = "",
+    profession_query: str = "",
+    vibe_report_query: str = "",
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """A user/assistant example pair, the assistant turn in the exact response format."""
+    response = {
+        "filters": {key: filters.get(key) for key in _FILTER_KEYS},
+        "education_query": education_query,
+        "profession_query": profession_query,
+        "vibe_report_query": vibe_report_query,
+    }
+    return (
+        {"role": "user", "content": USER_PROMPT_TEMPLATE.format(query=query)},
+        {"role": "assistant", "content": orjson.dumps(response).decode()},
+    )
+
+
+# Examples sent as conversation turns after the system prompt; together they
+# form the static prefix that OpenAI prompt caching reuses across calls
+FEW_SHOT_MESSAGES = [
+    message
+    for pair in (
+        _few_shot(
+            "IIT graduate software engineer age 25-32 loves guitar and hiking height atleast 150",
+            {"min_age": 25, "max_age": 32, "min_height": 59},
+            education_query="IIT graduate",
+            profession_query="software engineer",
+            vibe_report_query="guitar hiking",
+        ),
+        _few_shot(
+            "Doctor from Mumbai, caring and empathetic person, height 5'6 to 6'",
+            {"location": ["IN_MB"], "min_height": 66, "max_height": 72},
+            profession_query="doctor",
+            vibe_report_query="caring empathetic",
+        ),
+        _few_shot(
+            "CA or MBA, vegetarian, modern progressive mindset",
+            {"food_habit": ["VGT"]},
+            education_query="CA MBA",
+            vibe_report_query="modern progressive",
+        ),
+        _few_shot(
+            "Hindu girl from Delhi, age 28-35, loves travel and photography",
+            {"gender": ["female"], "religion": ["HI"], "location": ["IN_DEL"], "min_age": 28, "max_age": 35},
+            vibe_report_query="travel photography",
+        ),
+    )
+    for message in pair
+]
+
+# Part of every parse cache key, so prompt/schema edits never serve stale parses
+_PROMPT_DIGEST = hashlib.sha256(
+    (SYSTEM_PROMPT + USER_PROMPT_TEMPLATE).encode()
+    + orjson.dumps(FEW_SHOT_MESSAGES)
+    + orjson.dumps(QUERY_PARSER_SCHEMA, option=orjson.OPT_SORT_KEYS)
+).hexdigest()
+
+
+# Keyword → (filter key, code) for the deterministic fast path. Locations are
+# read from the LOCATION CODES block of SYSTEM_PROMPT so the two never drift.
+_FAST_KEYWORDS: Dict[str, Tuple[str, str]] = {
+    **{word: ("gender", "female") for word in (
+        "girl", "girls", "woman", "women", "female", "females", "bride", "lady", "ladies",
+    )},
+    **{word: ("gender", "male") for word in (
+        "boy", "boys", "man", "men", "male", "males", "groom", "guy", "guys",
+    )},
+    "hindu": ("religion", "HI"), "muslim": ("religion", "MU"), "christian": ("religion", "CR"),
+    "sikh": ("religion", "SI"), "jain": ("religion", "JA"), "buddhist": ("religion", "BU"),
+    "parsi": ("religion", "PA"), "jewish": ("religion", "JE"), "bahai": ("religion", "BA"),
+    "never married": ("marital_status", "NM"), "divorced": ("marital_status", "DV"),
+    "divorcee": ("marital_status", "DV"), "widowed": ("marital_status", "WD"),
+    "vegetarian": ("food_habit", "VGT"), "veg": ("food_habit", "VGT"),
+    "non vegetarian": ("food_habit", "NVT"), "non veg": ("food_habit", "NVT"),
+    "nonveg": ("food_habit", "NVT"), "eggetarian": ("food_habit", "EGT"),
+    "vegan": ("food_habit", "VGN"), "pescatarian": ("food_habit", "PST"),
+    "non smoker": ("smoking", "NS"), "nonsmoker": ("smoking", "NS"),
+    "social smoker": ("smoking", "SS"), "regular smoker": ("smoking", "SR"),
+    "non drinker": ("drinking", "DD"), "teetotaler": ("drinking", "DD"),
+    "teetotaller": ("drinking", "DD"), "social drinker": ("drinking", "DS"),
+    "regular drinker": ("drinking", "DR"),
+    **{
+        name.strip().lower(): ("location", code)
+        for code, name in re.findall(r"\b([A-Z]{2}_[A-Z]{2,3})=([^,\n]+)", SYSTEM_PROMPT)
+    },
+    "bengaluru": ("location", "IN_BLR"), "bombay": ("location", "IN_MB"),
+    "new delhi": ("location", "IN_DEL"), "gurgaon": ("location", "IN_GUR"),
+    "nyc": ("location", "US_NYC"),
+}
+
+# Words that carry no meaning once filters are extracted; any other leftover
+# word (hobbies, professions, negations, numbers) sends the query to the LLM
+_FAST_STOPWORDS = frozenset((
+    "a", "an", "the", "and", "or", "from", "in", "of", "with", "who", "is", "are",
+    "for", "looking", "seeking", "want", "need", "someone", "somebody", "person",
+    "profile", "profiles", "match", "matches", "partner", "based", "living", "lives",
+    "settled", "staying", "age", "aged", "years", "year", "yrs", "old", "height",
+    "income", "show", "me", "find", "search", "any", "only", "preferably", "i", "am",
+))
+
+# Height value: feet/inches (5'6", 5 ft 6), or a number with optional unit
+# (numbers >= 100 without a unit are cm, as in the LLM prompt)
+_H = r"\d\s*(?:'|ft|feet|foot)\s*(?:\d{1,2}\s*(?:\"|''|in(?:ches)?)?)?|\d{2,3}\s*(?:cm|in(?:ches)?)?"
+_AT_LEAST = r"(?:above|over|at\s*least|atleast|min(?:imum)?|>=?)"
+_AT_MOST = r"(?:below|under|at\s*most|atmost|max(?:imum)?|<=?)"
+_LAKHS = r"(?:lpa|lakhs?|l)\b"
+
+# (pattern, min key, max key); one-sided patterns capture a single group
+_FAST_RANGES: Tuple[Tuple["re.Pattern[str]", str, str], ...] = tuple(
+    (re.compile(pattern), min_key, max_key)
+    for pattern, min_key, max_key in (
+        (rf"\bheight\s*(?:between\s*|from\s*)?({_H})\s*(?:-|to|and)\s*({_H})", "min_height", "max_height"),
+        (rf"\b(?:height\s*{_AT_LEAST}|taller\s*than)\s*({_H})", "min_height", ""),
+        (rf"\b(?:height\s*{_AT_MOST}|shorter\s*than)\s*({_H})", "", "max_height"),
+        (rf"\bincome\s*(?:between\s*|from\s*)?(\d+)\s*(?:-|to|and)\s*(\d+)\s*{_LAKHS}", "min_income", "max_income"),
+        (rf"\bincome\s*{_AT_LEAST}\s*(\d+)\s*{_LAKHS}", "min_income", ""),
+        (rf"\b(\d+)\s*\+\s*{_LAKHS}", "min_income", ""),
+        (rf"\bincome\s*{_AT_MOST}\s*(\d+)\s*{_LAKHS}", "", "max_income"),
+        (r"\bage[ds]?\s*(?:between\s*|from\s*)?(\d{2})\s*(?:-|to|and)\s*(\d{2})\b", "min_age", "max_age"),
+        (r"\b(\d{2})\s*(?:-|to)\s*(\d{2})\s*(?:years?|yrs?)\b", "min_age", "max_age"),
+        (rf"\bage[ds]?\s*{_AT_LEAST}\s*(\d{{2}})\b", "min_age", ""),
+        (r"\bage[ds]?\s*(\d{2})\s*\+", "min_age", ""),
+        (r"\b(?:above|over|older\s*than)\s*(\d{2})\s*(?:years?|yrs?)\b", "min_age", ""),
+        (rf"\bage[ds]?\s*{_AT_MOST}\s*(\d{{2}})\b", "", "max_age"),
+        (r"\b(?:below|under|younger\s*than)\s*(\d{2})\s*(?:years?|yrs?)\b", "", "max_age"),
+    )
+)
+# (min, max) keys checked for inverted ranges after extraction
+_FAST_RANGE_PAIRS = (("min_age", "max_age"), ("min_height", "max_height"), ("min_income", "max_income"))
+_FAST_KEYWORD_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        r"[\s-]*".join(map(re.escape, phrase.split()))
+        for phrase in sorted(_FAST_KEYWORDS, key=len, reverse=True)
+    )
+    + r")\b"
+)
+_HEIGHT_FEET_RE = re.compile(r"(\d)\s*(?:'|ft|feet|foot)\s*(\d{1,2})?")
+_HEIGHT_NUMBER_RE = re.compile(r"(\d{2,3})\s*(cm|in)?")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+class FastParser:
+    """
+    Deterministic parser for queries that are nothing but filters.
+
+    Extracts age/height/income ranges with compiled regexes and categorical
+    codes with one keyword alternation, then accepts the result only if
+    what's left is stopwords. Anything with semantic content (education,
+    profession, traits) or an unrecognized word returns None so the caller
+    falls back to the LLM.
+    """
+
+    @staticmethod
+    def _height_inches(text: str) -> int:
+        """Height text (5'6", 170 cm, 66 in, 150) → inches."""
+        feet = _HEIGHT_FEET_RE.match(text)
+        if feet:
+            return int(feet.group(1)) * 12 + int(feet.group(2) or 0)
+        number = _HEIGHT_NUMBER_RE.match(text)
+        value, unit = int(number.group(1)), number.group(2)
+        if unit == "cm" or (unit is None and value >= 100):
+            return round(value / 2.54)
+        return value
+
+    @classmethod
+    def parse(cls, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a filter-only query.
+
+        Returns:
+            Parsed result in QueryParser's shape, or None if the query needs
+            the LLM
+        """
+        text = query.lower()
+        filters: Dict[str, Any] = {}
+
+        for pattern, min_key, max_key in _FAST_RANGES:
+            for match in pattern.finditer(text):
+                # Two-sided patterns capture (min, max); one-sided ones a single value
+                bounds = ((min_key, match.group(1)), (max_key, match.group(match.lastindex)))
+                for key, value in bounds:
+                    if not key:
+                        continue
+                    if key in filters:
+                        return None  # Conflicting bounds: let the LLM decide
+                    filters[key] = cls._height_inches(value) if "height" in key else int(value)
+            text = pattern.sub(" ", text)
+
+        for min_key, max_key in _FAST_RANGE_PAIRS:
+            if filters.get(min_key, 0) > filters.get(max_key, float("inf")):
+                return None  # Inverted range ("age 30-25") would match nothing
+
+        for match in _FAST_KEYWORD_RE.finditer(text):
+            key, code = _FAST_KEYWORDS[" ".join(match.group(0).replace("-", " ").split())]
+            values = filters.setdefault(key, [])
+            if code not in values:
+                values.append(code)
+        text = _FAST_KEYWORD_RE.sub(" ", text)
+
+        if not filters or not _FAST_STOPWORDS.issuperset(_WORD_RE.findall(text)):
+            return None
+
+        return {
+            "original_query": query,
+            "filters": filters,
+            "education_query": "",
+            "profession_query": "",
+            "vibe_report_query": "",
+        }
+
 
 class QueryParser:
     """
@@ -155,12 +347,27 @@ class QueryParser:
         if not self.api_key:
             raise ValueError("OpenAI API key required for query parsing")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_async_openai_client(self.api_key)
+
+        # LRU of successful parses, keyed by _cache_key(query); entries expire
+        # after query_parser_cache_ttl so model-side drift is picked up
+        self._cache: LRUCache[Dict[str, Any]] = LRUCache(
+            settings.query_parser_cache_size, ttl=settings.query_parser_cache_ttl
+        )
+        self.fast_path = settings.query_parser_fast_path
+        # In-flight LLM calls by cache key, shared by concurrent identical queries
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
 
-    def parse(self, query: str) -> Dict[str, Any]:
+    async def parse(self, query: str) -> Dict[str, Any]:
         """
         Parse natural language query into structured format.
 
+        Results are cached per normalized query text, and the cache is
+        checked first so a repeated query costs one lookup. On a miss,
+        filter-only queries are parsed locally by FastParser (when enabled)
+        without an LLM call; identical queries arriving while an LLM parse
+        is in flight await that same call. Failed parses are not cached.
+
         Args:
             query: Natural language search query
 
@@ -170,48 +377,126 @@ class QueryParser:
         if not query or not query.strip():
             return self._empty_response()
 
+        key = self._cache_key(query)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._from_cache(cached, query)
+
+        if self.fast_path:
+            fast = FastParser.parse(query)
+            if fast is not None:
+                self._cache.put(key, fast)
+                return self._from_cache(fast, query)
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._parse_and_cache(key, query))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one cancelled request doesn't cancel the shared call
+        parsed = await asyncio.shield(inflight)
+        if "error" not in parsed:
+            return self._from_cache(parsed, query)
+        return {**parsed, "original_query": query}
+
+    async def _parse_and_cache(self, key: str, query: str) -> Dict[str, Any]:
+        """Parse via the LLM and cache a successful result under key."""
+        parsed = await self._parse_uncached(query)
+        if "error" not in parsed:
+            self._cache.put(key, parsed)
+        return parsed
+
+    def _cache_key(self, query: str) -> str:
+        """SHA-256 over model + prompt digest + whitespace/case-normalized query."""
+        normalized = " ".join(query.lower().split())
+        return hashlib.sha256(f"{self.model}\0{_PROMPT_DIGEST}\0{normalized}".encode()).hexdigest()
+
+    @staticmethod
+    def _from_cache(entry: Dict[str, Any], query: str) -> Dict[str, Any]:
+        """Copy a cached parse so callers can't mutate the cached entry."""
+        return {**entry, "original_query": query, "filters": dict(entry["filters"])}
+
+    async def _parse_uncached(self, query: str) -> Dict[str, Any]:
+        """Call the LLM and normalize its response."""
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
+                    *FEW_SHOT_MESSAGES,
                     {"role": "user", "content": USER_PROMPT_TEMPLATE.format(query=query)},
                 ],
                 temperature=0,
                 response_format={"type": "json_schema", "json_schema": QUERY_PARSER_SCHEMA},
             )
 
-            # Log token usage and cache status
-            usage = response.usage
-            prompt_details = getattr(usage, 'prompt_tokens_details', None)
-            cached = prompt_details.cached_tokens if prompt_details and hasattr(prompt_details, 'cached_tokens') else 0
-            logger.info(f"Query Parser - Prompt: {usage.prompt_tokens} tokens, Cached: {cached}, Completion: {usage.completion_tokens}, Total: {usage.total_tokens}")
+            # Log token usage and cache status (skipped entirely when INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                usage = response.usage
+                prompt_details = getattr(usage, 'prompt_tokens_details', None)
+                cached = getattr(prompt_details, 'cached_tokens', None) or 0
+                logger.info(
+                    "Query Parser - Prompt: %d tokens, Cached: %d, Completion: %d, Total: %d",
+                    usage.prompt_tokens, cached, usage.completion_tokens, usage.total_tokens,
+                )
 
             content = response.choices[0].message.content
-            parsed = json.loads(content)
+            parsed = orjson.loads(content)
 
-            # Ensure all expected fields exist
             return self._normalize_response(parsed, query)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
+            # Safety net only: strict structured outputs always return valid JSON
             logger.error(f"Failed to parse JSON response: {e}")
             return self._empty_response(query, error=str(e))
         except Exception as e:
             logger.error(f"Query parsing failed: {e}")
             return self._empty_response(query, error=str(e))
 
+    async def parse_for_search(
+        self,
+        query: str,
+        request_filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Dict[str, str], Optional[Dict[str, Any]]]:
+        """
+        Parse a query into the shape the search route needs.
+
+        Args:
+            query: Natural language search query
+            request_filters: Explicit filters from the request (take precedence)
+
+        Returns:
+            Tuple of (parsed_queries, merged_filters or None)
+        """
+        parsed = await self.parse(query)
+        parsed_queries = {
+            "education_query": parsed["education_query"],
+            "profession_query": parsed["profession_query"],
+            "vibe_report_query": parsed["vibe_report_query"],
+        }
+
+        # parse() returns a fresh filters dict, so it's safe to merge in place
+        filters = parsed["filters"]
+        if not filters:
+            return parsed_queries, request_filters
+        if request_filters:
+            filters |= request_filters
+        return parsed_queries, filters
+
     def _normalize_response(self, parsed: Dict[str, Any], original_query: str) -> Dict[str, Any]:
-        """Normalize parsed response to ensure all fields exist and filter out nulls."""
-        # Filter out null values from filters
-        raw_filters = parsed.get("filters") or {}
-        filters = {k: v for k, v in raw_filters.items() if v is not None}
+        """
+        Shape a parser response for callers, dropping null filters.
 
+        The strict json_schema response format guarantees every key is
+        present with its declared type, so no fallbacks are needed here.
+        """
         return {
             "original_query": original_query,
-            "filters": filters,
-            "education_query": parsed.get("education_query") or "",
-            "profession_query": parsed.get("profession_query") or "",
-            "vibe_report_query": parsed.get("vibe_report_query") or "",
+            "filters": {k: v for k, v in parsed["filters"].items() if v is not None},
+            "education_query": parsed["education_query"],
+            "profession_query": parsed["profession_query"],
+            "vibe_report_query": parsed["vibe_report_query"],
         }
 
     def _empty_response(
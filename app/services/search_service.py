@@ -1,12 +1,16 @@
 """Search service orchestrating the search flow with OpenAI + ColBERT."""
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import get_settings
-from ..config.embedding_specs import VECTOR_CONFIG, get_required_providers
-from ..embeddings import EmbeddingProviderFactory
+from ..config.embedding_specs import (
+    VECTOR_SPEC,
+    get_required_providers,
+)
+from ..embeddings import EmbeddingProvider, EmbeddingProviderFactory
 from ..mappers import QueryMapper
 from ..vector_store import QdrantVectorStore
 from .filter_analysis import FilterAnalysisService
@@ -37,8 +41,11 @@ class SearchService:
         self.filter_analysis_service = FilterAnalysisService(vector_store)
         settings = get_settings()
         self.device = settings.embedding_device
+        # Providers bound by name on first use (or by warmup_providers), so the
+        # per-search path skips the factory's lazy-import and cache-key checks
+        self._providers: Dict[str, EmbeddingProvider] = {}
 
-    def search(
+    async def search(
         self,
         parsed_queries: Optional[Dict[str, str]] = None,
         filters: Optional[Dict[str, Any]] = None,
@@ -63,7 +70,7 @@ class SearchService:
         Returns:
             Search results with metadata and filter analysis
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Extract semantic queries
         semantic_queries = QueryMapper.extract_semantic_queries(parsed_queries or {})
@@ -86,10 +93,13 @@ class SearchService:
             }
 
         # Generate embeddings for semantic queries
-        dense_vectors, colbert_vectors = self._generate_embeddings(semantic_queries)
+        dense_vectors, colbert_vectors = await self._generate_embeddings(semantic_queries)
 
-        # Execute search
-        search_result = self.vector_store.search(
+        # Execute search and, if filters are applied, the filter analysis
+        # concurrently (sync Qdrant client, keep both off the event loop);
+        # the analysis runs its own counts and doesn't need the search result
+        search_call = asyncio.to_thread(
+            self.vector_store.search,
             dense_vectors=dense_vectors,
             colbert_vectors=colbert_vectors,
             filters=normalized_filters,
@@ -98,17 +108,17 @@ class SearchService:
             score_threshold=score_threshold,
             skip_ids=skip_ids,
         )
-
-        # Compute filter analysis if filters are applied
         filter_analysis = None
         if include_filter_analysis and normalized_filters:
-            filter_analysis = self._compute_filter_analysis(
-                normalized_filters,
-                search_result["total_count"]
+            search_result, filter_analysis = await asyncio.gather(
+                search_call,
+                asyncio.to_thread(self._compute_filter_analysis, normalized_filters),
             )
+        else:
+            search_result = await search_call
 
         # Calculate search time
-        search_time_ms = (time.time() - start_time) * 1000
+        search_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         return {
             "results": search_result["results"],
@@ -124,40 +134,27 @@ class SearchService:
     def _compute_filter_analysis(
         self,
         filters: Dict[str, Any],
-        current_count: int,
     ) -> Dict[str, Any]:
         """
         Compute filter impact analysis.
 
         Args:
             filters: Applied filters
-            current_count: Current result count with all filters
 
         Returns:
             Filter analysis dict
         """
         analysis = self.filter_analysis_service.analyze_filter_impact(filters)
 
-        # Format impacts for response
-        impacts = []
-        for impact in analysis["impacts"]:
-            impacts.append({
-                "filter": impact["filter"],
-                "value": impact["value"],
-                "count_with": impact["count_with"],
-                "count_without": impact["count_without"],
-                "removed_count": impact["removed_count"],
-                "impact_percentage": impact["impact_percentage"],
-            })
-
+        # Format impacts for response (FilterImpactRow → dict)
         return {
-            "impacts": impacts,
+            "impacts": [impact._asdict() for impact in analysis["impacts"]],
             "recommendations": analysis["recommendations"],
             "total_without_filters": analysis["total_without_filters"],
             "current_count": analysis["current_count"],
         }
 
-    def _generate_embeddings(
+    async def _generate_embeddings(
         self,
         semantic_queries: Dict[str, str]
     ) -> tuple:
@@ -176,35 +173,38 @@ class SearchService:
         if not semantic_queries:
             return dense_vectors, colbert_vectors
 
-        # Get required providers
-        providers_needed = set()
+        # Group fields by provider so each provider is called once per search
+        # (education + profession share one OpenAI round-trip); each entry
+        # carries its is_multivector flag so results need no second lookup
+        fields_by_provider: Dict[str, List[Tuple[str, bool]]] = {}
         for field in semantic_queries:
-            vector_config = VECTOR_CONFIG.get(field)
-            if vector_config:
-                providers_needed.add(vector_config["provider"])
-
-        # Load providers
-        providers = {}
-        for provider_name in providers_needed:
-            providers[provider_name] = EmbeddingProviderFactory.get_provider(
-                provider_name, device=self.device
-            )
-
-        # Generate embeddings
-        for field, query_text in semantic_queries.items():
-            vector_config = VECTOR_CONFIG.get(field)
-            if vector_config:
-                provider = providers.get(vector_config["provider"])
-                if provider:
-                    if vector_config["type"] == "multivector":
-                        # ColBERT vectors (vibe_report)
-                        colbert_vectors[field] = provider.embed(query_text)
-                    else:
-                        # Dense vectors (education, profession)
-                        dense_vectors[field] = provider.embed(query_text)
+            spec = VECTOR_SPEC.get(field)
+            if spec:
+                provider_name, is_multi = spec
+                fields_by_provider.setdefault(provider_name, []).append((field, is_multi))
+
+        # Generate embeddings, running the providers concurrently
+        providers = [self._get_provider(provider_name) for provider_name in fields_by_provider]
+        batches = await asyncio.gather(*(
+            provider.aembed_batch([semantic_queries[field] for field, _ in fields])
+            for provider, fields in zip(providers, fields_by_provider.values())
+        ))
+
+        for fields, embeddings in zip(fields_by_provider.values(), batches):
+            for (field, is_multi), embedding in zip(fields, embeddings):
+                # ColBERT vectors (vibe_report) vs dense (education, profession)
+                (colbert_vectors if is_multi else dense_vectors)[field] = embedding
 
         return dense_vectors, colbert_vectors
 
+    def _get_provider(self, provider_name: str) -> EmbeddingProvider:
+        """Return the provider bound to this service, binding it on first use."""
+        provider = self._providers.get(provider_name)
+        if provider is None:
+            provider = EmbeddingProviderFactory.get_provider(provider_name, device=self.device)
+            self._providers[provider_name] = provider
+        return provider
+
     def get_providers_status(self) -> Dict[str, bool]:
         """Get status of loaded embedding providers."""
         status = {}
@@ -214,13 +214,26 @@ class SearchService:
             )
         return status
 
-    def warmup_providers(self) -> None:
-        """Pre-load all embedding providers."""
-        for provider_name in get_required_providers():
-            logger.info(f"Loading provider: {provider_name}")
-            provider = EmbeddingProviderFactory.get_provider(
-                provider_name, device=self.device
-            )
-            # Warmup with a test embedding
-            provider.embed("warmup text")
-            logger.info(f"Provider loaded: {provider_name}")
\ No newline at end of file
+    async def warmup_providers(self) -> None:
+        """
+        Pre-load all embedding providers concurrently.
+
+        Each provider is loaded and run once in its own worker thread, so the
+        BGE-M3 model load overlaps with the OpenAI connection setup.
+        """
+        provider_names = sorted(get_required_providers())
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._warmup_provider, name) for name in provider_names),
+            return_exceptions=True,
+        )
+        for provider_name, result in zip(provider_names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to warmup provider {provider_name}: {result}")
+
+    def _warmup_provider(self, provider_name: str) -> None:
+        """Load a provider and run a test embedding through it."""
+        logger.info(f"Loading provider: {provider_name}")
+        provider = self._get_provider(provider_name)
+        # Warmup with a test embedding (tokenizer / first inference pass)
+        provider.embed("warmup text")
+        logger.info(f"Provider loaded: {provider_name}")
@@ -3,13 +3,16 @@
 import json
 import hashlib
 import logging
+import sqlite3
 from typing import Any, Dict, List, Optional
 
-from openai import OpenAI
+import xxhash
 
 logger = logging.getLogger(__name__)
 
+from ..cache import SQLiteCache
 from ..config import get_settings
+from ..openai_clients import get_openai_client
 
 VIBE_MAP_SCHEMA = {
     "name": "vibe_map",
@@ -139,6 +142,22 @@ Example Output:
 - Capture contradictions and dualities in the personality
 - Reference specific details from the input to show deep analysis"""
 
+VIBE_MAP_MODEL = "gpt-4o"
+
+# Prompt-cache health check. OpenAI only caches prompts of at least
+# _PROMPT_CACHE_MIN_TOKENS; over each window of that many eligible calls,
+# warn if more than _MAX_CACHE_MISS_RATIO of them had no cached tokens.
+# (A token ratio would be skewed by image tokens, which are never cached.)
+_PROMPT_CACHE_MIN_TOKENS = 1024
+_CACHE_MISS_WINDOW = 20
+_MAX_CACHE_MISS_RATIO = 0.5
+
+# Folded into vibe cache keys so prompt, schema or model edits invalidate
+# previously cached vibe maps
+_VIBE_PROMPT_DIGEST = hashlib.sha256(
+    f"{VIBE_MAP_MODEL}\0{VIBE_MAP_SYSTEM_PROMPT}\0{json.dumps(VIBE_MAP_SCHEMA, sort_keys=True)}".encode()
+).hexdigest()[:16]
+
 
 class VibeService:
     """Service for generating Vibe Reports using OpenAI."""
@@ -148,7 +167,20 @@ class VibeService:
         self.api_key = api_key or settings.openai_api_key
         if not self.api_key:
             raise ValueError("OpenAI API key not configured")
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
+
+        # Persistent cache of vibe map JSON, keyed by the vibe input hash; an
+        # unusable cache file disables caching rather than the service
+        self._cache: Optional[SQLiteCache] = None
+        if settings.vibe_cache_enabled:
+            try:
+                self._cache = SQLiteCache(settings.vibe_cache_path, ttl=settings.vibe_cache_ttl)
+            except sqlite3.Error as e:
+                logger.warning("Vibe cache disabled (%s): %s", settings.vibe_cache_path, e)
+
+        # Cache-eligible calls and misses since the last check (see _record_usage)
+        self._window_calls = 0
+        self._window_misses = 0
 
     def generate_vibe_map(
         self,
@@ -159,6 +191,9 @@ class VibeService:
         """
         Generate a Vibe Map for a User.
 
+        Results are cached (when enabled) under the vibe input hash, so an
+        unchanged profile skips the OpenAI call; failed parses aren't cached.
+
         Args:
             user: User model with education, profession, interests, blurb
             photo_urls: Optional list of {"id": "...", "url": "..."} dicts
@@ -167,15 +202,24 @@ class VibeService:
         Returns:
             Dict with vibeReport, trumpAdamsSummary, imageTags
         """
+        cache_key = None
+        if self._cache is not None:
+            input_hash = self.compute_vibe_input_hash(user, photo_urls)
+            cache_key = f"vibe:v1:{_VIBE_PROMPT_DIGEST}:{int(include_images)}:{input_hash}"
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return json.loads(cached)
+
         vibe_input = self._build_vibe_input(user, photo_urls)
 
-        # Build the user message
+        # Build the user message. Everything per-user stays here, after the
+        # static system prompt, so that prompt remains a cacheable prefix.
         user_content = []
 
         # Add text content
         user_content.append({
             "type": "text",
-            "text": f"Generate a Vibe Map for this user:\n\n{json.dumps(vibe_input, indent=2)}"
+            "text": f"Generate a Vibe Map for this user:\n\n{json.dumps(vibe_input, separators=(',', ':'), ensure_ascii=False)}"
         })
 
         # Add images if available and requested
@@ -188,7 +232,7 @@ class VibeService:
                     })
 
         response = self.client.chat.completions.create(
-            model="gpt-4o",
+            model=VIBE_MAP_MODEL,
             messages=[
                 {"role": "system", "content": VIBE_MAP_SYSTEM_PROMPT},
                 {"role": "user", "content": user_content}
@@ -197,19 +241,50 @@ class VibeService:
             max_tokens=2000
         )
 
-        # Log token usage and cache status
-        usage = response.usage
-        prompt_details = getattr(usage, 'prompt_tokens_details', None)
-        cached = prompt_details.cached_tokens if prompt_details and hasattr(prompt_details, 'cached_tokens') else 0
-        logger.info(f"Vibe API - Prompt: {usage.prompt_tokens} tokens, Cached: {cached}, Completion: {usage.completion_tokens}, Total: {usage.total_tokens}")
+        self._record_usage(response.usage)
 
         result_text = response.choices[0].message.content
 
         try:
-            return json.loads(result_text)
+            vibe_map = json.loads(result_text)
         except json.JSONDecodeError:
             return {"raw_response": result_text, "error": "Failed to parse JSON response"}
 
+        if cache_key is not None:
+            self._cache.put(cache_key, result_text)
+        return vibe_map
+
+    def _record_usage(self, usage: Any) -> None:
+        """
+        Log token usage and track prompt-cache misses.
+
+        Every _CACHE_MISS_WINDOW cache-eligible calls, warns if more than
+        _MAX_CACHE_MISS_RATIO of them got zero cached tokens: the static
+        system prompt should be a cached prefix, so repeated misses mean it
+        stopped being byte-stable. Counters are updated without a lock; a
+        lost increment under concurrent generation only skews one window.
+        """
+        prompt_details = getattr(usage, 'prompt_tokens_details', None)
+        cached = getattr(prompt_details, 'cached_tokens', None) or 0
+
+        if usage.prompt_tokens >= _PROMPT_CACHE_MIN_TOKENS:
+            self._window_calls += 1
+            self._window_misses += not cached
+            if self._window_calls >= _CACHE_MISS_WINDOW:
+                if self._window_misses > self._window_calls * _MAX_CACHE_MISS_RATIO:
+                    logger.warning(
+                        "Vibe API prompt cache missed on %d of %d calls (prompts >= %d tokens)",
+                        self._window_misses, self._window_calls, _PROMPT_CACHE_MIN_TOKENS,
+                    )
+                self._window_calls = self._window_misses = 0
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Vibe API - Prompt: %d tokens, Cached: %d (%.0f%%), Completion: %d, Total: %d",
+                usage.prompt_tokens, cached, cached / max(usage.prompt_tokens, 1) * 100,
+                usage.completion_tokens, usage.total_tokens,
+            )
+
     def _build_vibe_input(
         self,
         user: User,
@@ -236,10 +311,21 @@ class VibeService:
 
         This hash represents the content that affects vibe report generation,
         including photo IDs (not URLs, as URLs may change but same photos).
+
+        The result is memoized on the user (per set of photo IDs), so the
+        full-upsert and smart-update paths hash each user at most once.
+        Uses xxh128 (identity only, not security). The stored
+        vibe_report_hash is only checked for presence, never compared with a
+        recomputed value, so changing the algorithm regenerates no stored
+        vibe reports.
         """
         # Extract just photo IDs for hashing (URLs may change)
         photo_ids = sorted([p.get("id", "") for p in (photo_urls or [])])
 
+        cached = user._vibe_input_hash
+        if cached is not None and cached[0] == tuple(photo_ids):
+            return cached[1]
+
         hash_input = {
             "education": user.education or "",
             "profession": user.profession or "",
@@ -247,4 +333,8 @@ class VibeService:
             "blurb": user.blurb or "",
             "photo_ids": photo_ids
         }
-        return hashlib.md5(json.dumps(hash_input, sort_keys=True).encode()).hexdigest()
+        vibe_input_hash = xxhash.xxh128_hexdigest(
+            json.dumps(hash_input, sort_keys=True, separators=(",", ":")).encode()
+        )
+        user._vibe_input_hash = (tuple(photo_ids), vibe_input_hash)
+        return vibe_input_hash
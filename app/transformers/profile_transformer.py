@@ -1,9 +1,10 @@
 """Transform input profiles into Qdrant-ready payloads."""
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models.ingest import IngestUserProfile
+from ..models.object import compute_age
 
 
 class ProfileTransformer:
@@ -18,42 +19,48 @@ class ProfileTransformer:
     """
 
     @classmethod
-    def transform(cls, profile: IngestUserProfile) -> Dict[str, Any]:
+    def transform(
+        cls,
+        profile: IngestUserProfile,
+        today: Optional[Tuple[int, int, int]] = None,
+    ) -> Dict[str, Any]:
         """
         Transform an input profile into a Qdrant-ready payload.
 
         Args:
             profile: Input profile from API request
+            today: Optional (year, month, day) for age computation, computed
+                once by callers transforming a batch
 
         Returns:
             Dict with payload fields for Qdrant
         """
+        # Required fields in a single dict display (one map build, no
+        # per-key stores)
         payload = {
             "user_id": profile.user_id,
             "is_circulateable": cls._compute_is_circulateable(profile),
+            # Demographics
+            "gender": profile.gender,
+            "height": profile.height,
+            "location": profile.current_location,
+            # Filter fields
+            "religion": profile.religion,
+            "caste": profile.caste,
+            "fitness": profile.fitness,
+            "religiosity": profile.religiosity,
+            "smoking": profile.smoking,
+            "drinking": profile.drinking,
+            "food_habits": profile.food_habits,
+            "intent": profile.intent,
+            "open_to_children": profile.open_to_children,
         }
 
-        # Demographics (required fields)
-        payload["gender"] = profile.gender
-        payload["height"] = profile.height
-        payload["location"] = profile.current_location
-
         # Age from DOB
-        age = cls._calculate_age(profile.dob)
+        age = cls._calculate_age(profile.dob, today)
         if age is not None:
             payload["age"] = age
 
-        # Filter fields (required)
-        payload["religion"] = profile.religion
-        payload["caste"] = profile.caste
-        payload["fitness"] = profile.fitness
-        payload["religiosity"] = profile.religiosity
-        payload["smoking"] = profile.smoking
-        payload["drinking"] = profile.drinking
-        payload["food_habits"] = profile.food_habits
-        payload["intent"] = profile.intent
-        payload["open_to_children"] = profile.open_to_children
-
         # Optional filter fields
         if profile.family_type:
             payload["family_type"] = profile.family_type
@@ -82,6 +89,21 @@ class ProfileTransformer:
 
         return payload
 
+    @classmethod
+    def transform_batch(cls, profiles: List[IngestUserProfile]) -> List[Dict[str, Any]]:
+        """
+        Transform a batch of input profiles, resolving today's date once.
+
+        Args:
+            profiles: Input profiles from API request
+
+        Returns:
+            Payload dicts in input order
+        """
+        now = datetime.now()
+        today = (now.year, now.month, now.day)
+        return [cls.transform(profile, today) for profile in profiles]
+
     @classmethod
     def _compute_is_circulateable(cls, profile: IngestUserProfile) -> bool:
         """
@@ -105,31 +127,22 @@ class ProfileTransformer:
         )
 
     @classmethod
-    def _calculate_age(cls, dob: Optional[str]) -> Optional[int]:
+    def _calculate_age(
+        cls,
+        dob: Optional[str],
+        today: Optional[Tuple[int, int, int]] = None,
+    ) -> Optional[int]:
         """
         Calculate age from date of birth string.
 
         Args:
             dob: Date of birth in YYYY-MM-DD format
+            today: (year, month, day) to compute against (default: now)
 
         Returns:
             Age in years or None if DOB is invalid
         """
-        if not dob:
-            return None
-
-        try:
-            birth_date = datetime.strptime(dob, "%Y-%m-%d")
-            today = datetime.now()
-            age = today.year - birth_date.year
-
-            # Adjust if birthday hasn't occurred this year
-            if (today.month, today.day) < (birth_date.month, birth_date.day):
-                age -= 1
-
-            return age
-        except ValueError:
-            return None
+        return compute_age(dob, today)
 
     @classmethod
     def _build_education_text(cls, profile: IngestUserProfile) -> Optional[str]:
@@ -1,9 +1,33 @@
 """Filter building utilities for Qdrant queries."""
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from qdrant_client import models
 
+# Canonical filter dict: sorted (key, value) pairs with lists as tuples
+FrozenFilters = Tuple[Tuple[str, Hashable], ...]
+
+# Distinct filter combinations whose built Filter objects are memoized
+_FILTER_CACHE_SIZE = 2048
+
+
+def _freeze_filters(filters: Dict[str, Any]) -> Optional[FrozenFilters]:
+    """Hashable, key-order-independent form of a filter dict (None if a value can't be hashed)."""
+    key = tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in filters.items()
+    ))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _thaw_filters(key: FrozenFilters) -> Dict[str, Any]:
+    """Inverse of _freeze_filters."""
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in key}
+
 
 class FilterBuilder:
     """Build Qdrant filters from request parameters."""
@@ -16,6 +40,13 @@ class FilterBuilder:
         "income": "annual_income",  # API uses min_income/max_income, payload uses annual_income
     }
 
+    # (min_key, max_key, payload_field) per range filter, and the set of those keys
+    _RANGE_BOUNDS = tuple(
+        (f"min_{api_field}", f"max_{api_field}", payload_field)
+        for api_field, payload_field in RANGE_FIELD_MAPPING.items()
+    )
+    _RANGE_KEYS = frozenset(key for min_key, max_key, _ in _RANGE_BOUNDS for key in (min_key, max_key))
+
     # All categorical filters support multiple values (match_any)
     # Maps API key → Qdrant payload field
     MATCH_ANY_FIELDS = {
@@ -39,18 +70,32 @@ class FilterBuilder:
         "test_lead": "test_lead",
     }
 
-    # All categorical filter keys (all support arrays)
-    ARRAY_FILTER_KEYS = [
-        "gender", "religion", "location", "marital_status",
-        "family_type", "food_habit", "smoking", "drinking",
-        "religiosity", "fitness", "intent", "caste", "open_to_children"
-    ]
+    # Payload flags checked by build_default_filters
+    DEFAULT_FILTER_FLAGS = ("is_circulateable", "is_paused", "test_lead")
+
+    # Filter returned by build_default_filters (immutable by convention)
+    _DEFAULT_FILTER = models.Filter(
+        must=[
+            models.FieldCondition(key="is_circulateable", match=models.MatchValue(value=True)),
+        ],
+        must_not=[
+            models.FieldCondition(key="is_paused", match=models.MatchValue(value=True)),
+            models.FieldCondition(key="test_lead", match=models.MatchValue(value=True)),
+        ],
+    )
+
+    # All categorical filter keys (all support arrays), derived so the two
+    # lists can't drift apart
+    ARRAY_FILTER_KEYS = list(MATCH_ANY_FIELDS)
 
     @classmethod
     def build(cls, filters: Dict[str, Any]) -> Optional[models.Filter]:
         """
         Convert filter dict to Qdrant Filter object.
 
+        Results are memoized per distinct filter combination (in any key
+        order), so the returned Filter is shared and must not be mutated.
+
         Args:
             filters: Dict containing filter parameters
 
@@ -59,45 +104,50 @@ class FilterBuilder:
         """
         if not filters:
             return None
+        key = _freeze_filters(filters)
+        return _build_cached(key) if key is not None else cls._build(filters)
 
+    @classmethod
+    def _build(cls, filters: Dict[str, Any]) -> Optional[models.Filter]:
+        """Build the Filter for a non-empty filter dict (uncached)."""
         conditions = []
 
-        # Range filters
-        for api_field, payload_field in cls.RANGE_FIELD_MAPPING.items():
-            min_key = f"min_{api_field}"
-            max_key = f"max_{api_field}"
-
-            min_val = filters.get(min_key)
-            max_val = filters.get(max_key)
+        # Range filters (skipped outright when no min_/max_ key is present)
+        if not cls._RANGE_KEYS.isdisjoint(filters):
+            for min_key, max_key, payload_field in cls._RANGE_BOUNDS:
+                min_val = filters.get(min_key)
+                max_val = filters.get(max_key)
 
-            if min_val is not None or max_val is not None:
-                range_cond = models.FieldCondition(
-                    key=payload_field,
-                    range=models.Range(
-                        gte=min_val,
-                        lte=max_val
+                if min_val is not None or max_val is not None:
+                    range_cond = models.FieldCondition(
+                        key=payload_field,
+                        range=models.Range(
+                            gte=min_val,
+                            lte=max_val
+                        )
                     )
-                )
-                conditions.append(range_cond)
-
-        # Match any filters (all categorical fields support multiple values)
-        for api_key, payload_field in cls.MATCH_ANY_FIELDS.items():
-            if api_key in filters and filters[api_key]:
-                values = filters[api_key]
-                if isinstance(values, str):
-                    values = [values]
-                if values:  # Non-empty list
+                    conditions.append(range_cond)
+
+        # Match-any (all categorical fields support multiple values) and
+        # boolean filters, in one pass over the request's own keys
+        match_any_fields = cls.MATCH_ANY_FIELDS
+        boolean_fields = cls.BOOLEAN_FIELDS
+        for api_key, value in filters.items():
+            payload_field = match_any_fields.get(api_key)
+            if payload_field is not None:
+                if value:  # Non-empty string or list
                     conditions.append(models.FieldCondition(
                         key=payload_field,
-                        match=models.MatchAny(any=values)
+                        match=models.MatchAny(any=[value] if isinstance(value, str) else value)
                     ))
+                continue
 
-        # Boolean filters (exact match)
-        for api_key, payload_field in cls.BOOLEAN_FIELDS.items():
-            if api_key in filters and filters[api_key] is not None:
+            # Boolean filters (exact match)
+            payload_field = boolean_fields.get(api_key)
+            if payload_field is not None and value is not None:
                 conditions.append(models.FieldCondition(
                     key=payload_field,
-                    match=models.MatchValue(value=filters[api_key])
+                    match=models.MatchValue(value=value)
                 ))
 
         if not conditions:
@@ -171,39 +221,35 @@ class FilterBuilder:
         - is_circulateable = True (profile is allowed to be shown)
         - is_paused != True (profile is not paused by user)
         - test_lead != True (exclude test users in controlled production)
+
+        Built once at class creation; the returned Filter is shared and must
+        not be mutated.
         """
-        return models.Filter(
-            must=[
-                models.FieldCondition(
-                    key="is_circulateable",
-                    match=models.MatchValue(value=True)
-                ),
-            ],
-            must_not=[
-                models.FieldCondition(
-                    key="is_paused",
-                    match=models.MatchValue(value=True)
-                ),
-                models.FieldCondition(
-                    key="test_lead",
-                    match=models.MatchValue(value=True)
-                ),
-            ]
-        )
+        return cls._DEFAULT_FILTER
 
     @classmethod
     def build_with_defaults(cls, filters: Optional[Dict[str, Any]] = None) -> models.Filter:
         """
         Build filters with default filters always applied.
 
+        Memoized like `build`; the returned Filter must not be mutated.
+
         Args:
             filters: Optional user-provided filters
 
         Returns:
             Combined filter with defaults + user filters
         """
+        key = _freeze_filters(filters) if filters else ()
+        if key is not None:
+            return _build_with_defaults_cached(key)
+        return cls._build_with_defaults(filters)
+
+    @classmethod
+    def _build_with_defaults(cls, filters: Optional[Dict[str, Any]]) -> models.Filter:
+        """Combine default and user filters (uncached)."""
         default_filter = cls.build_default_filters()
-        user_filter = cls.build(filters) if filters else None
+        user_filter = cls._build(filters) if filters else None
 
         if user_filter is None:
             return default_filter
@@ -226,3 +272,15 @@ class FilterBuilder:
             must=combined_must if combined_must else None,
             must_not=combined_must_not if combined_must_not else None
         )
+
+
+@lru_cache(maxsize=_FILTER_CACHE_SIZE)
+def _build_cached(key: FrozenFilters) -> Optional[models.Filter]:
+    """Memoized FilterBuilder.build, keyed by _freeze_filters."""
+    return FilterBuilder._build(_thaw_filters(key))
+
+
+@lru_cache(maxsize=_FILTER_CACHE_SIZE)
+def _build_with_defaults_cached(key: FrozenFilters) -> models.Filter:
+    """Memoized FilterBuilder.build_with_defaults, keyed by _freeze_filters."""
+    return FilterBuilder._build_with_defaults(_thaw_filters(key) or None)
@@ -1,18 +1,26 @@
 """Qdrant vector store wrapper."""
 
+import asyncio
 import logging
-import uuid
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+import numpy as np
 from qdrant_client import QdrantClient, models
 from qdrant_client.http.exceptions import UnexpectedResponse
 
 from ..config.embedding_specs import VECTOR_CONFIG
+from ..mappers import profile_point_id
 from .filters import FilterBuilder
-from .query_builder import DynamicQueryBuilder, QueryContext, QueryMode
+from .query_builder import DynamicQueryBuilder, QueryContext, QueryMode, vector_to_list
 
 logger = logging.getLogger(__name__)
 
+# Range payload fields that aren't integers (annual_income is stored as float)
+_RANGE_INDEX_SCHEMAS = {
+    "annual_income": models.PayloadSchemaType.FLOAT,
+}
+
 
 class QdrantVectorStore:
     """
@@ -30,17 +38,26 @@ class QdrantVectorStore:
         host: str = "localhost",
         port: int = 6333,
         collection_name: str = "matrimonial_profiles",
+        grpc_port: int = 6334,
+        prefer_grpc: bool = False,
     ):
         """
         Initialize Qdrant client.
 
         Args:
             host: Qdrant host
-            port: Qdrant port
+            port: Qdrant REST port
             collection_name: Name of the collection
+            grpc_port: Qdrant gRPC port
+            prefer_grpc: Use gRPC instead of REST for all requests
         """
         self.collection_name = collection_name
-        self.client = QdrantClient(host=host, port=port)
+        self.client = QdrantClient(
+            host=host,
+            port=port,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
+        )
 
     def create_collection(self, recreate: bool = False) -> bool:
         """
@@ -63,23 +80,28 @@ class QdrantVectorStore:
         collections = self.client.get_collections().collections
         if any(c.name == self.collection_name for c in collections):
             logger.info(f"Collection already exists: {self.collection_name}")
+            # Backfill indexes added since the collection was created (async)
+            self._create_payload_indexes(wait=False)
             return False
 
         # Build vectors config from VECTOR_CONFIG
         vectors_config = {}
         for vector_name, config in VECTOR_CONFIG.items():
+            quantization_config = self._quantization_config(config.get("quantization"))
             if config["type"] == "multivector":
                 vectors_config[vector_name] = models.VectorParams(
                     size=config["dim"],
                     distance=models.Distance.COSINE,
                     multivector_config=models.MultiVectorConfig(
                         comparator=models.MultiVectorComparator.MAX_SIM
-                    )
+                    ),
+                    quantization_config=quantization_config,
                 )
             else:
                 vectors_config[vector_name] = models.VectorParams(
                     size=config["dim"],
                     distance=models.Distance.COSINE,
+                    quantization_config=quantization_config,
                 )
 
         self.client.create_collection(
@@ -93,28 +115,54 @@ class QdrantVectorStore:
         logger.info(f"Created collection: {self.collection_name}")
         return True
 
-    def _create_payload_indexes(self) -> None:
-        """Create indexes for filterable payload fields."""
-        # Integer fields (for range queries)
-        for field in ["age", "height", "income"]:
-            self.client.create_payload_index(
-                collection_name=self.collection_name,
-                field_name=field,
-                field_schema=models.PayloadSchemaType.INTEGER,
+    @staticmethod
+    def _quantization_config(
+        quantization: Optional[str],
+    ) -> Optional[Union[models.BinaryQuantization, models.ScalarQuantization]]:
+        """
+        Qdrant quantization config for a VECTOR_CONFIG "quantization" value.
+
+        Codes are kept in RAM (originals stay on disk for rescoring).
+        """
+        if quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        if quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
             )
+        return None
 
-        # Keyword fields (for match/match_any queries)
-        keyword_fields = [
-            "id", "gender", "religion", "location",
-            "marital_status", "family_type", "food_habits",
-            "smoking", "drinking", "religiosity", "fitness", "intent",
-            "caste", "open_to_children"
-        ]
-        for field in keyword_fields:
+    def _create_payload_indexes(self, wait: bool = True) -> None:
+        """
+        Create indexes for filterable payload fields.
+
+        Derived from the FilterBuilder mappings (plus the default-filter
+        flags) so every key a filter or count can touch is indexed under its
+        payload name. Re-creating an existing index is a no-op in Qdrant.
+
+        Args:
+            wait: Wait for each index to be built
+        """
+        schemas: Dict[str, models.PayloadSchemaType] = {"id": models.PayloadSchemaType.KEYWORD}
+        for field in FilterBuilder.RANGE_FIELD_MAPPING.values():
+            schemas[field] = _RANGE_INDEX_SCHEMAS.get(field, models.PayloadSchemaType.INTEGER)
+        for field in FilterBuilder.MATCH_ANY_FIELDS.values():
+            schemas[field] = models.PayloadSchemaType.KEYWORD
+        for field in (*FilterBuilder.BOOLEAN_FIELDS.values(), *FilterBuilder.DEFAULT_FILTER_FLAGS):
+            schemas[field] = models.PayloadSchemaType.BOOL
+
+        for field, schema in schemas.items():
             self.client.create_payload_index(
                 collection_name=self.collection_name,
                 field_name=field,
-                field_schema=models.PayloadSchemaType.KEYWORD,
+                field_schema=schema,
+                wait=wait,
             )
 
     def upsert_points(
@@ -140,7 +188,7 @@ class QdrantVectorStore:
             for p in batch:
                 qdrant_points.append(models.PointStruct(
                     id=p["id"],
-                    vector=p["vectors"],
+                    vector=self._vectors_to_lists(p["vectors"]),
                     payload=p["payload"],
                 ))
 
@@ -152,10 +200,57 @@ class QdrantVectorStore:
 
         return total
 
+    async def aupsert_batches(
+        self,
+        batches: Iterable[List[Dict[str, Any]]],
+        concurrency: int = 2,
+    ) -> int:
+        """
+        Upsert point batches with bounded concurrency.
+
+        Each batch is pulled from `batches` in a worker thread (so lazy
+        mapping/embedding runs off the event loop) while up to `concurrency`
+        previous batches are still uploading.
+
+        Args:
+            batches: Iterable of point-dict lists (id, vectors, payload)
+            concurrency: Max upserts in flight
+
+        Returns:
+            Number of points upserted
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        iterator = iter(batches)
+        tasks = []
+
+        async def upsert(batch: List[Dict[str, Any]]) -> int:
+            try:
+                return await asyncio.to_thread(self.upsert_points, batch, len(batch))
+            finally:
+                semaphore.release()
+
+        while True:
+            await semaphore.acquire()
+            batch = await asyncio.to_thread(next, iterator, None)
+            if batch is None:
+                semaphore.release()
+                break
+            if not batch:
+                semaphore.release()
+                continue
+            tasks.append(asyncio.create_task(upsert(batch)))
+
+        return sum(await asyncio.gather(*tasks))
+
+    @staticmethod
+    def _vectors_to_lists(vectors: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert named ndarray embeddings to lists at the last moment before upload."""
+        return {name: vector_to_list(vector) for name, vector in vectors.items()}
+
     def update_vectors(
         self,
         point_id: str,
-        vectors: Dict[str, Union[List[float], List[List[float]]]],
+        vectors: Dict[str, Union[np.ndarray, List[float], List[List[float]]]],
     ) -> bool:
         """
         Update specific vectors for a point (partial update).
@@ -172,7 +267,7 @@ class QdrantVectorStore:
             points=[
                 models.PointVectors(
                     id=point_id,
-                    vector=vectors,
+                    vector=self._vectors_to_lists(vectors),
                 )
             ],
         )
@@ -181,7 +276,7 @@ class QdrantVectorStore:
     def search(
         self,
         dense_vectors: Optional[Dict[str, List[float]]] = None,
-        colbert_vectors: Optional[Dict[str, List[List[float]]]] = None,
+        colbert_vectors: Optional[Dict[str, Union[np.ndarray, List[List[float]]]]] = None,
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 50,
         offset: int = 0,
@@ -212,10 +307,7 @@ class QdrantVectorStore:
         # Add skip_ids filter if provided
         if skip_ids:
             # Convert profile IDs to point IDs
-            point_ids_to_skip = [
-                str(uuid.uuid5(uuid.NAMESPACE_DNS, profile_id))
-                for profile_id in skip_ids
-            ]
+            point_ids_to_skip = [profile_point_id(profile_id) for profile_id in skip_ids]
             # Add to existing must_not conditions
             existing_must_not = list(filter_obj.must_not or [])
             existing_must_not.append(models.HasIdCondition(has_id=point_ids_to_skip))
@@ -307,12 +399,13 @@ class QdrantVectorStore:
                 with_vectors=False,
             )
         else:
-            # Single vector: use direct query
+            # Single vector: query it directly. Prefetching the same vector
+            # first would only make Qdrant traverse the index twice.
             search_results = self.client.query_points(
                 collection_name=self.collection_name,
-                prefetch=prefetch,
                 query=request["query"],
                 using=request["using"],
+                search_params=request.get("search_params"),
                 query_filter=request.get("filter"),
                 limit=request["limit"],
                 offset=request.get("offset", 0),
@@ -363,6 +456,23 @@ class QdrantVectorStore:
         except Exception:
             return None
 
+    def get_points(self, point_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get many points by ID in one retrieve call.
+
+        Returns:
+            {point_id: payload} for the points that exist
+        """
+        if not point_ids:
+            return {}
+        points = self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=point_ids,
+            with_payload=True,
+            with_vectors=False,
+        )
+        return {str(point.id): point.payload or {} for point in points}
+
     def delete_point(self, point_id: str) -> bool:
         """Delete a point by ID."""
         self.client.delete(
@@ -393,6 +503,41 @@ class QdrantVectorStore:
         )
         return True
 
+    def batch_update(
+        self,
+        payload_updates: Dict[str, Dict[str, Any]],
+        vector_updates: Dict[str, Dict[str, Any]],
+    ) -> bool:
+        """
+        Apply partial payload and vector updates for many points in one request.
+
+        Args:
+            payload_updates: {point_id: fields to update}
+            vector_updates: {point_id: {vector_name: embedding}}
+
+        Returns:
+            True if successful
+        """
+        operations: List[Any] = [
+            models.SetPayloadOperation(
+                set_payload=models.SetPayload(payload=payload, points=[point_id])
+            )
+            for point_id, payload in payload_updates.items()
+        ]
+        if vector_updates:
+            operations.append(models.UpdateVectorsOperation(
+                update_vectors=models.UpdateVectors(points=[
+                    models.PointVectors(id=point_id, vector=self._vectors_to_lists(vectors))
+                    for point_id, vectors in vector_updates.items()
+                ])
+            ))
+        if operations:
+            self.client.batch_update_points(
+                collection_name=self.collection_name,
+                update_operations=operations,
+            )
+        return True
+
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Get total count of points matching filters."""
         filter_obj = FilterBuilder.build(filters) if filters else None
@@ -402,6 +547,58 @@ class QdrantVectorStore:
             exact=True,
         ).count
 
+    def facet(
+        self,
+        field: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+    ) -> Dict[Any, int]:
+        """
+        Count points per value of an indexed payload field in one request.
+
+        Args:
+            field: Payload field (must have a keyword/integer/bool index)
+            filters: Optional filters scoping the counted points
+            limit: Maximum number of distinct values returned
+
+        Returns:
+            {value: count}, most frequent first
+        """
+        filter_obj = FilterBuilder.build(filters) if filters else None
+        response = self.client.facet(
+            collection_name=self.collection_name,
+            key=field,
+            facet_filter=filter_obj,
+            limit=limit,
+            exact=True,
+        )
+        return {hit.value: hit.count for hit in response.hits}
+
+    def count_batch(
+        self,
+        filters_list: List[Optional[Dict[str, Any]]],
+        max_workers: int = 8,
+    ) -> List[int]:
+        """
+        Count points for several filter dicts concurrently.
+
+        The sync client has no batch count API, so the requests are issued
+        from a thread pool (sharing the client's connection pool / gRPC
+        channel): wall time is ~one round-trip instead of one per filter.
+
+        Args:
+            filters_list: Filter dicts (None or {} counts the whole collection)
+            max_workers: Upper bound on concurrent count requests
+
+        Returns:
+            Counts in the same order as filters_list
+        """
+        if len(filters_list) <= 1:
+            return [self.count(filters) for filters in filters_list]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(filters_list))) as executor:
+            return list(executor.map(self.count, filters_list))
+
     def collection_info(self) -> Dict[str, Any]:
         """Get collection information."""
         info = self.client.get_collection(self.collection_name)
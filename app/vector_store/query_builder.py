@@ -1,14 +1,40 @@
 """Dynamic query builder for Qdrant with OpenAI + ColBERT."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from qdrant_client import models
 
-from ..config.embedding_specs import VECTOR_CONFIG
+from ..config.embedding_specs import QUANTIZED_VECTORS
 from ..config.settings import get_settings
 
+# Search quantized vectors on their binary/int8 codes, then rescore an oversampled
+# candidate set with the original floats to recover accuracy.
+QUANTIZED_SEARCH_PARAMS = models.SearchParams(
+    quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
+)
+
+
+def vector_to_list(vector: Union[np.ndarray, List[Any]]) -> List[Any]:
+    """
+    Convert an embedding to the plain lists Qdrant's REST models expect.
+
+    Providers may hand back ndarrays (ColBERT) so the conversion happens once,
+    right before the request is built, instead of inside every provider.
+    """
+    if isinstance(vector, np.ndarray):
+        return vector.tolist()
+    return vector
+
+
+def search_params_for(vector_name: str) -> Optional[models.SearchParams]:
+    """Return search params for a named vector (None if it isn't quantized)."""
+    if vector_name in QUANTIZED_VECTORS:
+        return QUANTIZED_SEARCH_PARAMS
+    return None
+
 
 class QueryMode(Enum):
     """Query mode based on input analysis."""
@@ -20,7 +46,7 @@ class QueryMode(Enum):
 class QueryContext:
     """Context for building a search query."""
     dense_vectors: Dict[str, List[float]]
-    colbert_vectors: Dict[str, List[List[float]]]
+    colbert_vectors: Dict[str, Union[np.ndarray, List[List[float]]]]
     filter_obj: Optional[models.Filter]
     limit: int
     offset: int = 0
@@ -89,6 +115,7 @@ class DynamicQueryBuilder:
                     using=field,
                     limit=settings.prefetch_limit,
                     filter=context.filter_obj,
+                    params=search_params_for(field),
                 ))
                 vectors_used.append(f"{field}(openai)")
 
@@ -126,8 +153,13 @@ class DynamicQueryBuilder:
 
         if mode == QueryMode.FILTER_ONLY:
             return cls._build_filter_only_request(context)
-        else:
-            return cls._build_semantic_request(context)
+
+        # Convert ndarray embeddings once, shared by prefetch and main query
+        context = replace(context, colbert_vectors={
+            field: vector_to_list(vector)
+            for field, vector in context.colbert_vectors.items()
+        })
+        return cls._build_semantic_request(context)
 
     @classmethod
     def _build_filter_only_request(cls, context: QueryContext) -> Dict[str, Any]:
@@ -169,6 +201,7 @@ class DynamicQueryBuilder:
             "prefetch": prefetches,
             "query": main_vector,
             "using": main_using,
+            "search_params": search_params_for(main_using),
             "filter": context.filter_obj,
             "limit": context.limit,
             "offset": context.offset,
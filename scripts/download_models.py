@@ -25,6 +25,18 @@ def download_bge_m3():
     print(f"BGE-M3 model downloaded successfully. Test embedding shape: {result['colbert_vecs'][0].shape}")
 
 
+def download_fastembed():
+    """Download the fastembed ONNX model used when DENSE_PROVIDER=fastembed-small."""
+    print("Downloading fastembed BGE-small model...")
+    from fastembed import TextEmbedding
+
+    model = TextEmbedding("BAAI/bge-small-en-v1.5", cache_dir=os.environ["HF_HOME"])
+    embedding = next(iter(model.embed(["test"])))
+    print(f"fastembed model downloaded successfully. Test embedding shape: {embedding.shape}")
+
+
 if __name__ == "__main__":
     download_bge_m3()
+    if os.environ.get("DENSE_PROVIDER") == "fastembed-small":
+        download_fastembed()
     print("All models downloaded successfully!")
@@ -8,12 +8,13 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import logging
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -76,12 +77,40 @@ def generate_embeddings_for_profile(
     return vectors
 
 
+def embedded_profiles(
+    profiles: List[Dict[str, Any]],
+    providers: Dict[str, Any],
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Yield (profile, vectors) for valid profiles, embedding lazily."""
+    for profile in profiles:
+        # Validate profile
+        errors = ProfileMapper.validate_profile(profile)
+        if errors:
+            logger.warning(f"Skipping invalid profile: {errors}")
+            continue
+
+        # Generate embeddings
+        vectors = generate_embeddings_for_profile(profile, providers)
+
+        if not vectors:
+            logger.warning(f"No vectors generated for profile {profile.get('user_id')}")
+            continue
+
+        yield profile, vectors
+
+
 def ingest_profiles(
     profiles: List[Dict[str, Any]],
     vector_store: QdrantVectorStore,
     batch_size: int = 50,
+    concurrency: int = 2,
 ) -> int:
-    """Ingest profiles with OpenAI + ColBERT embeddings."""
+    """
+    Ingest profiles with OpenAI + ColBERT embeddings.
+
+    Embedding/mapping of the next batch overlaps with up to `concurrency`
+    batches uploading to Qdrant.
+    """
     settings = get_settings()
     device = settings.embedding_device
 
@@ -96,42 +125,12 @@ def ingest_profiles(
             provider_name, device=device
         )
 
-    # Process profiles in batches
-    total_ingested = 0
-    total_profiles = len(profiles)
-
-    for batch_start in range(0, total_profiles, batch_size):
-        batch_end = min(batch_start + batch_size, total_profiles)
-        batch = profiles[batch_start:batch_end]
-
-        logger.info(f"Processing batch {batch_start + 1}-{batch_end} of {total_profiles}")
-
-        points = []
-        for profile in batch:
-            # Validate profile
-            errors = ProfileMapper.validate_profile(profile)
-            if errors:
-                logger.warning(f"Skipping invalid profile: {errors}")
-                continue
-
-            # Generate embeddings
-            vectors = generate_embeddings_for_profile(profile, providers)
-
-            if not vectors:
-                logger.warning(f"No vectors generated for profile {profile.get('user_id')}")
-                continue
-
-            # Convert to Qdrant point
-            point = ProfileMapper.to_qdrant_point(profile, vectors)
-            points.append(point.to_dict())
-
-        # Upsert batch
-        if points:
-            vector_store.upsert_points(points)
-            total_ingested += len(points)
-            logger.info(f"  Ingested {len(points)} profiles")
-
-    return total_ingested
+    logger.info(f"Processing {len(profiles)} profiles in batches of {batch_size}")
+    batches = ProfileMapper.iter_qdrant_point_batches(
+        embedded_profiles(profiles, providers),
+        batch_size=batch_size,
+    )
+    return asyncio.run(vector_store.aupsert_batches(batches, concurrency=concurrency))
 
 
 def main():
@@ -152,6 +151,12 @@ def main():
         default=50,
         help="Batch size for processing (default: 50)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=2,
+        help="Concurrent Qdrant upserts (default: 2)"
+    )
 
     args = parser.parse_args()
 
@@ -191,6 +196,7 @@ def main():
             profiles,
             vector_store,
             batch_size=args.batch_size,
+            concurrency=args.concurrency,
         )
     except Exception as e:
         logger.error(f"Ingestion failed: {e}")